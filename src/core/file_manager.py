@@ -2,9 +2,11 @@
 File Manager module for handling file operations with folder structure preservation.
 """
 
+import errno
 import os
 import shutil
 import time
+import uuid
 from pathlib import Path
 from typing import Optional, List
 import logging
@@ -91,12 +93,12 @@ class FileManager:
             Path: Complete destination path with preserved structure
         """
         try:
-            # Resolve both paths to handle symlinks and relative paths consistently
+            # Resolve the file path to handle symlinks and relative paths consistently
+            # (source_folder is already resolved in __init__)
             resolved_source = source_path.resolve()
-            resolved_source_folder = self.source_folder.resolve()
             
             # Get relative path from source folder to the file
-            relative_path = resolved_source.relative_to(resolved_source_folder)
+            relative_path = resolved_source.relative_to(self.source_folder)
             
             # Combine with destination base to preserve structure
             dest_path = dest_base / relative_path
@@ -247,7 +249,12 @@ class FileManager:
     
     def _atomic_move(self, source_path: Path, dest_path: Path) -> None:
         """
-        Perform an atomic move operation with fallback strategies.
+        Perform an atomic move operation with a cross-device fallback.
+        
+        Within one filesystem the move is a single rename and no data is
+        copied. Across filesystems (EXDEV) the file is copied to a temporary
+        name in the destination folder, flushed to disk and renamed into
+        place, so the destination never holds a partial file.
         
         Args:
             source_path: Source file path
@@ -257,23 +264,37 @@ class FileManager:
             Various exceptions if all move strategies fail
         """
         try:
-            # Try atomic move first (same filesystem)
-            shutil.move(str(source_path), str(dest_path))
+            # Try atomic rename first (same filesystem)
+            os.replace(str(source_path), str(dest_path))
+            return
         except OSError as e:
-            # If atomic move fails, try copy + delete
-            self.logger.warning(f"Atomic move failed, trying copy+delete: {e}")
-            try:
-                shutil.copy2(str(source_path), str(dest_path))
-                source_path.unlink()  # Delete original after successful copy
-            except Exception as copy_error:
-                # Clean up partial copy if it exists
-                if dest_path.exists():
-                    try:
-                        dest_path.unlink()
-                    except Exception as cleanup_error:
-                        # Log cleanup failure but don't let it mask the original error
-                        print(f"WARNING: Failed to clean up partial file copy {dest_path}: {cleanup_error}")
-                raise copy_error from e
+            if e.errno != errno.EXDEV:
+                raise
+            self.logger.warning(f"Cross-device move, staging copy in destination folder: {e}")
+            move_error = e
+        
+        temp_path = dest_path.parent / f".tmp_move_{uuid.uuid4().hex}"
+        placed = False
+        try:
+            # Flush the data while the copy is still writable (Windows needs
+            # write access to flush), then apply the source's mode and times
+            shutil.copyfile(str(source_path), str(temp_path))
+            with open(temp_path, 'r+b') as f:
+                os.fsync(f.fileno())
+            shutil.copystat(str(source_path), str(temp_path))
+            os.replace(str(temp_path), str(dest_path))
+            placed = True
+            source_path.unlink()  # Delete original after the copy is in place
+        except Exception as copy_error:
+            # Clean up the staged or placed copy so the source stays the only one
+            leftover = dest_path if placed else temp_path
+            if leftover.exists():
+                try:
+                    leftover.unlink()
+                except Exception as cleanup_error:
+                    # Log cleanup failure but don't let it mask the original error
+                    print(f"WARNING: Failed to clean up partial file copy {leftover}: {cleanup_error}")
+            raise copy_error from move_error
     
     def _is_folder_empty(self, folder_path: Path) -> bool:
         """
@@ -345,7 +366,7 @@ class FileManager:
         try:
             # Start with the folder that contained the file
             current_folder = Path(original_file_path).parent.resolve()
-            source_folder_resolved = self.source_folder.resolve()
+            source_folder_resolved = self.source_folder  # Resolved once in __init__
             
             # Safety check: ensure we're working within the source folder
             if not self._is_path_under_source(current_folder, source_folder_resolved):
@@ -362,8 +383,9 @@ class FileManager:
                         removed_folders.append(str(current_folder))
                         self.logger.info(f"Removed empty folder: {current_folder}")
                         
-                        # Move to parent folder for next iteration
-                        current_folder = current_folder.parent.resolve()
+                        # Move to parent folder for next iteration (parent of a
+                        # resolved path is already resolved)
+                        current_folder = current_folder.parent
                         
                     except (OSError, PermissionError) as e:
                         # Log warning and stop cleanup
@@ -383,18 +405,17 @@ class FileManager:
         """
         Check if a path is under the source folder.
         
+        Both paths must already be resolved; the check is a pure path
+        comparison and performs no filesystem access.
+        
         Args:
-            path: Path to check
-            source_folder: Source folder path
+            path: Resolved path to check
+            source_folder: Resolved source folder path
             
         Returns:
             bool: True if path is under source folder, False otherwise
         """
-        try:
-            path.resolve().relative_to(source_folder)
-            return True
-        except ValueError:
-            return False
+        return path.is_relative_to(source_folder)
     
     def is_completely_empty_folder(self, folder_path: str) -> bool:
         """
@@ -428,7 +449,7 @@ class FileManager:
             self.logger.warning(f"Could not check if folder is completely empty {folder_path}: {e}")
             return False
     
-    def should_process_as_empty_folder(self, folder_path: str) -> bool:
+    def should_process_as_empty_folder(self, folder_path: str, known_empty: bool = False) -> bool:
         """
         Determine if a folder should be processed as an empty folder.
         
@@ -441,18 +462,20 @@ class FileManager:
         
         Args:
             folder_path: Path to the folder to check
+            known_empty: True if the caller has just listed the folder and
+                found nothing in it, so the emptiness check can be skipped
             
         Returns:
             bool: True if folder should be processed as empty, False otherwise
         """
         # First check if folder is actually completely empty
-        if not self.is_completely_empty_folder(folder_path):
+        if not known_empty and not self.is_completely_empty_folder(folder_path):
             return False
         
         # Check if saved/error folders already contain files from this source location
         try:
             folder_path_resolved = Path(folder_path).resolve()
-            relative_path = folder_path_resolved.relative_to(self.source_folder.resolve())
+            relative_path = folder_path_resolved.relative_to(self.source_folder)
             
             # Check both saved and error folder equivalents
             for dest_folder, folder_type in [(self.saved_folder, "saved"), (self.error_folder, "error")]:
@@ -6,10 +6,15 @@ to monitor file system events and trigger file processing when new files are cre
 """
 
 import os
+import stat
 import time
+import random
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Set, List
+from typing import Optional, Dict, Iterator, List, Set, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileCreatedEvent
 
@@ -17,6 +22,16 @@ from src.services.logger_service import LoggerService
 from src.core.file_processor import FileProcessor
 
 
+@dataclass
+class _Burst:
+    """Repeat events for a path that was just processed, held until it goes quiet."""
+    first_seen: float
+    last_seen: float
+    signature: Optional[Tuple[int, int]]
+    events: int = 0
+    timer: Optional[threading.Timer] = None
+
+
 class FileEventHandler(FileSystemEventHandler):
     """
     Event handler for file system events with resilience and error handling.
@@ -25,6 +40,19 @@ class FileEventHandler(FileSystemEventHandler):
     Includes duplicate event filtering and graceful error handling.
     """
     
+    # Number of recently seen file paths remembered for duplicate filtering,
+    # and how many seconds a path is remembered after its last event
+    RECENT_FILES_CAPACITY = 128
+    RECENT_FILES_TTL = 60.0
+    
+    # Repeat events for a just-processed path are held until none has arrived
+    # for DEBOUNCE_WINDOW seconds, or DEBOUNCE_MAX_WAIT seconds have passed
+    DEBOUNCE_WINDOW = 0.05
+    DEBOUNCE_MAX_WAIT = 0.5
+    
+    # Processing errors that are reported straight away instead of retried
+    NON_RETRYABLE_ERRORS = (FileNotFoundError, PermissionError, IsADirectoryError)
+    
     def __init__(self, file_processor: FileProcessor, logger_service: LoggerService):
         """
         Initialize the event handler.
@@ -37,10 +65,14 @@ class FileEventHandler(FileSystemEventHandler):
         self.file_processor = file_processor
         self.logger = logger_service
         
-        # Track recently processed files to avoid duplicates
-        self._recent_files: Set[str] = set()
+        # Track recently processed files to avoid duplicates: an LRU of
+        # path -> monotonic time of its last event, least recent first
+        self._recent_files: "OrderedDict[str, float]" = OrderedDict()
         self._recent_files_lock = threading.Lock()
         
+        # Open debounce bursts, guarded by the recent-files lock
+        self._pending: Dict[str, _Burst] = {}
+        
         # Statistics
         self.stats = {
             'events_received': 0,
@@ -77,6 +109,10 @@ class FileEventHandler(FileSystemEventHandler):
                 return
             
             # Handle file creation
+            # Hold repeat events for a just-processed path until it goes quiet
+            if self._is_debounced(event_path):
+                return
+            
             # Filter duplicate events
             if self._is_duplicate_event(event_path):
                 self.stats['duplicate_events_filtered'] += 1
@@ -101,15 +137,171 @@ class FileEventHandler(FileSystemEventHandler):
             # Log the file creation event
             self.logger.log_info(f"New file detected: {event_path}")
             
-            # Process the file with resilience
+            # Process the file with resilience, then hold any repeat events
+            signature = self._get_signature_or_none(event_path)
             self._process_file_with_resilience(event_path)
-            
+            self._open_burst(event_path, signature)
+        
         except Exception as e:
             self.stats['processing_errors'] += 1
             error_msg = f"Critical error in event handler for {event_path}: {str(e)}"
             self.logger.log_error(error_msg, e)
             # Continue processing other files despite this error
     
+    def on_modified(self, event):
+        """
+        Handle file modification events for a path that was just processed.
+        
+        New files are announced by creation events, so modifications are only
+        held in the open debounce burst for their path: if the file changed,
+        the burst processes its latest version once it goes quiet.
+        
+        Args:
+            event: FileSystemEvent representing the file modification
+        """
+        if event.is_directory:
+            return
+        
+        try:
+            if self._is_debounced(event.src_path, settle_expired=True):
+                self.stats['events_received'] += 1
+        except Exception as e:
+            self.stats['processing_errors'] += 1
+            self.logger.log_error(f"Critical error in event handler for {event.src_path}: {str(e)}", e)
+    
+    def _is_debounced(self, file_path: str, settle_expired: bool = False) -> bool:
+        """
+        Check if this event belongs to the open debounce burst for its path.
+        
+        An event arriving within DEBOUNCE_WINDOW of the previous one, and
+        within DEBOUNCE_MAX_WAIT of the burst opening, is held and (re)arms
+        the flush timer. The path is then settled once, when it goes quiet.
+        
+        Args:
+            file_path: Path to check
+            settle_expired: Settle a burst that is already over, for callers
+                that won't process the event themselves
+        
+        Returns:
+            bool: True if the event was held in the burst
+        """
+        now = time.monotonic()
+        with self._recent_files_lock:
+            burst = self._pending.get(file_path)
+            if burst is None:
+                return False
+            
+            if (now - burst.last_seen < self.DEBOUNCE_WINDOW
+                    and now - burst.first_seen < self.DEBOUNCE_MAX_WAIT):
+                burst.last_seen = now
+                burst.events += 1
+                if burst.timer is None:
+                    burst.timer = self._start_flush_timer(file_path, self.DEBOUNCE_WINDOW)
+                return True
+            
+            # The burst is over; this event is processed in its place
+            del self._pending[file_path]
+        
+        if burst.timer is not None:
+            burst.timer.cancel()
+        if settle_expired and burst.events:
+            self._settle_burst(file_path, burst)
+        else:
+            self.stats['duplicate_events_filtered'] += burst.events
+        return False
+    
+    def _open_burst(self, file_path: str, signature: Optional[Tuple[int, int]]) -> None:
+        """
+        Start holding repeat events for a path that was just processed.
+        
+        Args:
+            file_path: Path that was just processed
+            signature: File signature taken before it was processed, or None
+        """
+        now = time.monotonic()
+        with self._recent_files_lock:
+            self._pending[file_path] = _Burst(first_seen=now, last_seen=now, signature=signature)
+            
+            # Drop quiet bursts that never held an event so the table stays small
+            if len(self._pending) > self.RECENT_FILES_CAPACITY:
+                self._pending = {
+                    path: burst for path, burst in self._pending.items()
+                    if burst.events or now - burst.last_seen < self.DEBOUNCE_WINDOW
+                }
+    
+    def _start_flush_timer(self, file_path: str, delay: float) -> threading.Timer:
+        """Start a daemon timer that flushes the burst for a path."""
+        timer = threading.Timer(delay, self._flush_burst, args=(file_path,))
+        timer.daemon = True
+        timer.start()
+        return timer
+    
+    def _flush_burst(self, file_path: str) -> None:
+        """
+        Settle the burst for a path if it has gone quiet, or re-arm its timer.
+        
+        Args:
+            file_path: Path whose flush timer fired
+        """
+        now = time.monotonic()
+        with self._recent_files_lock:
+            burst = self._pending.get(file_path)
+            if burst is None:
+                return
+            
+            quiet_for = now - burst.last_seen
+            if quiet_for < self.DEBOUNCE_WINDOW and now - burst.first_seen < self.DEBOUNCE_MAX_WAIT:
+                burst.timer = self._start_flush_timer(file_path, self.DEBOUNCE_WINDOW - quiet_for)
+                return
+            
+            del self._pending[file_path]
+        
+        self._settle_burst(file_path, burst)
+    
+    def flush_pending(self) -> None:
+        """
+        Settle every open debounce burst now instead of waiting for it to go quiet.
+        """
+        with self._recent_files_lock:
+            bursts = self._pending
+            self._pending = {}
+        
+        for file_path, burst in bursts.items():
+            if burst.timer is not None:
+                burst.timer.cancel()
+            if burst.events:
+                self._settle_burst(file_path, burst)
+    
+    def _settle_burst(self, file_path: str, burst: _Burst) -> None:
+        """
+        Process a path once more if it changed while its events were held.
+        
+        A burst for a file that is unchanged or gone (processing moves it out
+        of the source folder) only repeated the event already processed. A
+        different signature means a new file or new content, which is
+        processed once for the whole burst.
+        
+        Args:
+            file_path: Path the burst was held for
+            burst: The burst, already removed from the pending table
+        """
+        signature = self._get_signature_or_none(file_path)
+        if signature is None or signature == burst.signature:
+            self.stats['duplicate_events_filtered'] += burst.events
+            return
+        
+        self.stats['duplicate_events_filtered'] += burst.events - 1
+        if self._is_duplicate_event(file_path):
+            self.stats['duplicate_events_filtered'] += 1
+            return
+        
+        try:
+            self.logger.log_info(f"File changed after processing: {file_path}")
+            self._process_file_with_resilience(file_path)
+        except Exception as e:
+            self.stats['processing_errors'] += 1
+            self.logger.log_error(f"Critical error processing held events for {file_path}: {str(e)}", e)
+    
     def _is_duplicate_event(self, file_path: str) -> bool:
         """
         Check if this file was recently processed to avoid duplicate processing.
@@ -120,33 +312,41 @@ class FileEventHandler(FileSystemEventHandler):
         Returns:
             bool: True if this is a duplicate event
         """
+        now = time.monotonic()
         with self._recent_files_lock:
-            if file_path in self._recent_files:
-                return True
+            # Forget paths whose last event is older than the TTL; they sit
+            # at the front, so this stops at the first live entry
+            recent = self._recent_files
+            while recent and now - next(iter(recent.values())) >= self.RECENT_FILES_TTL:
+                recent.popitem(last=False)
             
-            # Add to recent files and clean up old entries
-            self._recent_files.add(file_path)
+            is_duplicate = file_path in recent
+            recent[file_path] = now
+            recent.move_to_end(file_path)
             
-            # Keep only recent entries (simple cleanup)
-            if len(self._recent_files) > 100:
-                # Remove oldest entries (simplified approach)
-                self._recent_files = set(list(self._recent_files)[-50:])
+            # Evict the least recently seen path once over capacity
+            if len(recent) > self.RECENT_FILES_CAPACITY:
+                recent.popitem(last=False)
             
-            return False
+            return is_duplicate
     
-    def _process_file_with_resilience(self, file_path: str) -> None:
+    def _process_file_with_resilience(self, file_path: str, already_stable: bool = False) -> None:
         """
         Process a file with resilience and stability checks.
         
         Args:
             file_path: Path to the file to process
+            already_stable: True if the caller has just confirmed the file is
+                stable, so the first stability wait can be skipped
         """
         max_stability_checks = 5
         stability_delay = 0.2
+        retry_delay = 0.05
         
         # Wait for file to be stable (fully written)
         for check in range(max_stability_checks):
-            if not self._wait_for_file_stability(file_path, stability_delay):
+            skip_stability_wait = already_stable and check == 0
+            if not skip_stability_wait and not self._wait_for_file_stability(file_path, stability_delay):
                 self.logger.log_error(f"File stability check failed: {file_path}")
                 return
             
@@ -166,20 +366,28 @@ class FileEventHandler(FileSystemEventHandler):
                 
                 # Remove from recent files after successful processing
                 with self._recent_files_lock:
-                    self._recent_files.discard(file_path)
+                    self._recent_files.pop(file_path, None)
                 
                 return
                 
             except Exception as e:
+                if isinstance(e, self.NON_RETRYABLE_ERRORS):
+                    # Retrying cannot fix a missing file or a permission problem
+                    error_msg = f"File processing failed with non-retryable error: {file_path}: {str(e)}"
+                    self.logger.log_error(error_msg, e)
+                    self.stats['processing_errors'] += 1
+                    return
+                
                 if check == max_stability_checks - 1:
                     # Final attempt failed
                     error_msg = f"File processing failed after {max_stability_checks} attempts: {file_path}: {str(e)}"
                     self.logger.log_error(error_msg, e)
                     self.stats['processing_errors'] += 1
                 else:
-                    # Retry after brief delay
+                    # Retry with exponential backoff plus a little jitter
                     self.logger.log_error(f"File processing attempt {check + 1} failed, retrying: {e}")
-                    time.sleep(stability_delay * (check + 1))
+                    time.sleep(retry_delay + random.random() * 0.01)
+                    retry_delay *= 2
     
     def _wait_for_file_stability(self, file_path: str, delay: float) -> bool:
         """
@@ -193,23 +401,75 @@ class FileEventHandler(FileSystemEventHandler):
             bool: True if file appears stable
         """
         try:
-            if not os.path.exists(file_path):
-                return False
-            
-            # Get initial file size
-            initial_size = os.path.getsize(file_path)
+            # Sample size and mtime (a missing file raises FileNotFoundError)
+            initial_signature = self._get_file_signature(file_path)
             time.sleep(delay)
             
-            # Check if size changed
-            if not os.path.exists(file_path):
-                return False
-            
-            final_size = os.path.getsize(file_path)
-            return initial_size == final_size
+            # Check if the file was written to in between
+            final_signature = self._get_file_signature(file_path)
+            return initial_signature == final_signature
             
         except OSError:
             return False
     
+    def _wait_for_many_stable(self, file_paths: List[str], delay: float) -> Set[str]:
+        """
+        Check a batch of files for stability with a single shared wait.
+        
+        Args:
+            file_paths: Paths to check
+            delay: Delay between the two samples
+            
+        Returns:
+            Set[str]: Paths whose size and mtime did not change during the wait
+        """
+        initial_signatures = {}
+        for file_path in file_paths:
+            try:
+                initial_signatures[file_path] = self._get_file_signature(file_path)
+            except OSError:
+                continue
+        
+        if not initial_signatures:
+            return set()
+        
+        time.sleep(delay)
+        
+        stable = set()
+        for file_path, initial_signature in initial_signatures.items():
+            try:
+                if self._get_file_signature(file_path) == initial_signature:
+                    stable.add(file_path)
+            except OSError:
+                continue
+        return stable
+    
+    def _get_file_signature(self, file_path: str) -> Tuple[int, int]:
+        """
+        Get the size and modification time of a file with a single stat call.
+        
+        Comparing two signatures also catches writes that leave the size
+        unchanged, which a size-only check would miss.
+        
+        Args:
+            file_path: Path to check
+            
+        Returns:
+            Tuple[int, int]: File size in bytes and mtime in nanoseconds
+            
+        Raises:
+            OSError: If the file does not exist or cannot be accessed
+        """
+        st = os.stat(file_path)
+        return st.st_size, st.st_mtime_ns
+    
+    def _get_signature_or_none(self, file_path: str) -> Optional[Tuple[int, int]]:
+        """Get a file's signature, or None if it does not exist or cannot be read."""
+        try:
+            return self._get_file_signature(file_path)
+        except OSError:
+            return None
+    
     def _validate_file_ready(self, file_path: str) -> bool:
         """
         Validate that file exists and is ready for processing.
@@ -221,13 +481,16 @@ class FileEventHandler(FileSystemEventHandler):
             bool: True if file is ready
         """
         try:
-            if not os.path.exists(file_path):
+            # One stat call answers both "does it exist" and "what is it"
+            try:
+                mode = os.stat(file_path).st_mode
+            except FileNotFoundError:
                 self.logger.log_error(f"File no longer exists: {file_path}")
                 return False
             
-            if not os.path.isfile(file_path):
+            if not stat.S_ISREG(mode):
                 # If it's a directory, handle it with recursive processing
-                if os.path.isdir(file_path):
+                if stat.S_ISDIR(mode):
                     self.logger.log_info(f"Directory found during file validation, processing recursively: {file_path}")
                     self._process_directory_recursively(file_path)
                     return False  # Don't continue with file processing
@@ -235,9 +498,9 @@ class FileEventHandler(FileSystemEventHandler):
                     self.logger.log_error(f"Path is not a file: {file_path}")
                     return False
             
-            # Test basic read access
-            with open(file_path, 'rb') as f:
-                f.read(1)  # Try to read one byte
+            # Test basic read access without opening the file
+            if not os.access(file_path, os.R_OK):
+                raise PermissionError(f"No read access to file: {file_path}")
             
             return True
             
@@ -303,7 +566,8 @@ class FileEventHandler(FileSystemEventHandler):
             
             self.logger.log_info(f"Total files found in directory after {max_retries} attempts: {len(found_files)}")
             
-            # Now process each file
+            # Filter out duplicates and ignored files before processing
+            files_to_process = []
             for file_path in found_files:
                 try:
                     file_path_str = str(file_path)
@@ -330,11 +594,26 @@ class FileEventHandler(FileSystemEventHandler):
                             self.logger.log_info(f"Ignoring system/temporary file: {relative_path}")
                         continue
                     
+                    files_to_process.append(file_path)
+                    
+                except Exception as e:
+                    self.logger.log_error(f"Error processing file {file_path} from directory: {e}")
+                    self.stats['processing_errors'] += 1
+            
+            # Wait for stability once for the whole batch instead of once per file
+            stable_files = self._wait_for_many_stable([str(f) for f in files_to_process], 0.2)
+            
+            # Now process each file
+            for file_path in files_to_process:
+                try:
+                    file_path_str = str(file_path)
                     relative_path = file_path.relative_to(dir_path)
                     self.logger.log_info(f"Processing file from directory: {relative_path}")
                     
-                    # Process the file
-                    self._process_file_with_resilience(file_path_str)
+                    # Process the file, re-checking stability only if the batch check failed
+                    self._process_file_with_resilience(
+                        file_path_str, already_stable=file_path_str in stable_files
+                    )
                     processed_count += 1
                     
                 except Exception as e:
@@ -363,8 +642,14 @@ class FileMonitor:
     when new files are created.
     """
     
+    # Seconds a source folder health check result is reused by is_monitoring
+    HEALTH_CHECK_TTL = 1.0
+    
+    # Upper bound on worker threads for a parallel empty folder scan
+    MAX_SCAN_WORKERS = 8
+    
     def __init__(self, source_folder: str, file_processor: FileProcessor, 
-                 logger_service: LoggerService):
+                 logger_service: LoggerService, parallel_scan: bool = False):
         """
         Initialize FileMonitor with source folder and processor.
         
@@ -372,6 +657,8 @@ class FileMonitor:
             source_folder: Path to the folder to monitor
             file_processor: FileProcessor instance for processing files
             logger_service: LoggerService instance for logging
+            parallel_scan: Scan top-level subfolders for empty folders in
+                parallel threads; worthwhile on wide trees over network mounts
             
         Raises:
             ValueError: If source folder doesn't exist or is not a directory
@@ -379,9 +666,13 @@ class FileMonitor:
         self.source_folder = Path(source_folder).resolve()
         self.file_processor = file_processor
         self.logger = logger_service
+        self.parallel_scan = parallel_scan
         self.observer: Optional[Observer] = None
         self.event_handler: Optional[FileEventHandler] = None
         
+        # Cached source folder health check: (monotonic timestamp, healthy)
+        self._health_cache: Optional[Tuple[float, bool]] = None
+        
         # Validate source folder
         if not self.source_folder.exists():
             raise ValueError(f"Source folder does not exist: {self.source_folder}")
@@ -407,6 +698,7 @@ class FileMonitor:
         """
         max_attempts = 3
         base_delay = 1.0
+        self._health_cache = None
         
         for attempt in range(max_attempts):
             try:
@@ -470,6 +762,7 @@ class FileMonitor:
         
         Stops the observer and waits for it to finish gracefully.
         """
+        self._health_cache = None
         try:
             if self.observer and self.observer.is_alive():
                 self.observer.stop()
@@ -480,6 +773,10 @@ class FileMonitor:
                 else:
                     self.logger.log_info("File system monitoring stopped")
             
+            # Don't leave held events waiting on a timer after shutdown
+            if self.event_handler:
+                self.event_handler.flush_pending()
+        
         except Exception as e:
             error_msg = f"Error stopping file system monitoring: {str(e)}"
             self.logger.log_error(error_msg, e)
@@ -497,18 +794,63 @@ class FileMonitor:
         if not self.observer.is_alive():
             return False
         
-        # Additional health checks
+        # Reuse a recent source folder health check
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < self.HEALTH_CHECK_TTL:
+            return self._health_cache[1]
+        
+        healthy = self._check_source_folder_health()
+        self._health_cache = (now, healthy)
+        return healthy
+    
+    def _check_source_folder_health(self) -> bool:
+        """
+        Verify the source folder is still an accessible directory.
+        
+        Returns:
+            bool: True if the source folder is healthy, False otherwise
+        """
         try:
-            # Verify source folder is still accessible
-            if not self.source_folder.exists() or not self.source_folder.is_dir():
-                self.logger.log_error(f"Source folder is no longer accessible: {self.source_folder}")
-                return False
-            
-            return True
+            # A single stat covers both the existence and the directory check
+            if stat.S_ISDIR(os.stat(self.source_folder).st_mode):
+                return True
             
+        except OSError:
+            pass
         except Exception as e:
             self.logger.log_error(f"Health check failed for file monitor: {e}")
             return False
+        
+        self.logger.log_error(f"Source folder is no longer accessible: {self.source_folder}")
+        return False
+    
+    def wait_ready(self, timeout: float = 2.0) -> bool:
+        """
+        Wait until the observer is watching the source folder.
+        
+        Replaces fixed sleeps after start_monitoring: returns as soon as the
+        observer and all of its emitters are running, and an inotify emitter
+        has registered its watches.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            bool: True if monitoring is ready, False if the timeout expired
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.observer is not None and self.observer.is_alive():
+                emitters = self.observer.emitters
+                if emitters and all(
+                    emitter.is_alive() and getattr(emitter, '_inotify', True) is not None
+                    for emitter in emitters
+                ):
+                    return True
+            
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
     
     def get_monitoring_stats(self) -> dict:
         """
@@ -545,28 +887,91 @@ class FileMonitor:
         Returns:
             List[str]: List of paths to completely empty folders found
         """
-        empty_folders = []
+        return list(self._iter_empty_folders())
+    
+    def _iter_empty_folders(self) -> Iterator[str]:
+        """
+        Yield completely empty folders under the source folder as they are found.
         
+        With parallel_scan enabled, each top-level subfolder is scanned in its
+        own worker thread and results arrive in completion order.
+        
+        Yields:
+            str: Path to a completely empty folder
+        """
         try:
             # Get FileManager instance from FileProcessor
             file_manager = getattr(self.file_processor, 'file_manager', None)
             if not file_manager:
                 self.logger.log_error("FileManager not available for empty folder detection")
-                return empty_folders
+                return
+            
+            if not self.parallel_scan:
+                yield from self._scan_subtree(str(self.source_folder), file_manager)
+                return
+            
+            with os.scandir(self.source_folder) as it:
+                top_level = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+            if not top_level:
+                return
             
-            # Recursively scan for empty folders
-            for root, dirs, files in os.walk(self.source_folder):
-                # Check each directory
-                for dir_name in dirs:
-                    dir_path = os.path.join(root, dir_name)
-                    if file_manager.should_process_as_empty_folder(dir_path):
-                        empty_folders.append(dir_path)
-                        self.logger.log_info(f"Found completely empty folder: {dir_path}")
+            with ThreadPoolExecutor(max_workers=min(self.MAX_SCAN_WORKERS, len(top_level))) as pool:
+                futures = [
+                    pool.submit(lambda root: list(self._scan_subtree(root, file_manager)), root)
+                    for root in top_level
+                ]
+                for future in as_completed(futures):
+                    yield from future.result()
             
         except Exception as e:
             self.logger.log_error(f"Error scanning for empty folders: {e}")
+    
+    def _scan_subtree(self, root: str, file_manager) -> Iterator[str]:
+        """
+        Depth-first scan of one directory tree for completely empty folders.
+        
+        Args:
+            root: Directory to scan; reported itself if empty, unless it is
+                the source folder
+            file_manager: FileManager deciding which empty folders to process
+        
+        Yields:
+            str: Path to a completely empty folder
+        """
+        # The source folder was resolved once in __init__; only its string
+        # form is needed per directory
+        source_root = str(self.source_folder)
         
-        return empty_folders
+        # DirEntry caches the file type from readdir, so subdirectories are
+        # found without a stat each
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            has_entries = False
+            subdirs = []
+            try:
+                # Keep only subdirectory paths, not every DirEntry
+                with os.scandir(current) as it:
+                    for entry in it:
+                        has_entries = True
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+            except OSError:
+                # Unreadable or vanished directory, skip it like os.walk does
+                continue
+            
+            # Only a folder with nothing in it can be completely empty; the
+            # listing above already proves it, so FileManager need not re-list
+            if not has_entries:
+                if current != source_root and file_manager.should_process_as_empty_folder(
+                    current, known_empty=True
+                ):
+                    self.logger.log_info(f"Found completely empty folder: {current}")
+                    yield current
+                continue
+            
+            # Push in reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
     
     def handle_empty_folders(self) -> int:
         """
@@ -578,9 +983,8 @@ class FileMonitor:
         processed_count = 0
         
         try:
-            empty_folders = self.scan_for_empty_folders()
-            
-            for folder_path in empty_folders:
+            # Handle each folder as soon as the scan finds it
+            for folder_path in self._iter_empty_folders():
                 try:
                     # Process the empty folder through FileProcessor
                     result = self.file_processor.process_empty_folder(folder_path)
@@ -648,7 +1052,8 @@ class FileMonitor:
         processed_count = 0
         
         try:
-            source_path = Path(self.source_folder)
+            # Already resolved once in __init__
+            source_path = self.source_folder
             
             if not source_path.exists():
                 self.logger.log_error(f"Source folder does not exist: {self.source_folder}")
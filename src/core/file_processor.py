@@ -6,6 +6,7 @@ integrating with FileManager for file movement and ErrorHandler for error handli
 """
 
 import os
+import random
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Callable
@@ -30,20 +31,40 @@ class RetryConfig:
     """Configuration for retry logic."""
     
     def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, 
-                 max_delay: float = 10.0, backoff_multiplier: float = 2.0):
+                 max_delay: float = 10.0, backoff_multiplier: float = 2.0,
+                 rng: Optional[random.Random] = None):
         """
         Initialize retry configuration.
         
+        Retries use full-jitter backoff: each wait is drawn uniformly from
+        zero up to the exponential backoff ceiling for that attempt.
+        
         Args:
             max_attempts: Maximum number of retry attempts
-            base_delay: Initial delay between retries in seconds
-            max_delay: Maximum delay between retries in seconds
+            base_delay: Backoff ceiling for the first retry in seconds
+            max_delay: Maximum backoff ceiling in seconds
             backoff_multiplier: Multiplier for exponential backoff
+            rng: Random source for the jitter; pass a seeded instance for
+                reproducible delays
         """
         self.max_attempts = max_attempts
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.backoff_multiplier = backoff_multiplier
+        self.rng = rng or random.Random()
+    
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Get the jittered delay before retrying after a failed attempt.
+        
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+        
+        Returns:
+            float: Seconds to wait, between 0 and the capped backoff ceiling
+        """
+        ceiling = min(self.max_delay, self.base_delay * self.backoff_multiplier ** attempt)
+        return self.rng.uniform(0, ceiling)
 
 
 @dataclass
@@ -837,7 +858,6 @@ class FileProcessor:
             Exception: The last exception if all retries fail
         """
         last_exception = None
-        delay = self.retry_config.base_delay
         
         for attempt in range(self.retry_config.max_attempts):
             try:
@@ -863,14 +883,14 @@ class FileProcessor:
                 
                 # Log retry attempt
                 self.stats['retries_attempted'] += 1
+                delay = self.retry_config.backoff_delay(attempt)
                 self.logger.log_info(
                     f"{operation_name} failed on attempt {attempt + 1} ({error_type.value} error), "
                     f"retrying in {delay:.1f}s: {str(e)}"
                 )
                 
-                # Wait before retry with exponential backoff
+                # Wait before retry with full-jitter exponential backoff
                 time.sleep(delay)
-                delay = min(delay * self.retry_config.backoff_multiplier, self.retry_config.max_delay)
         
         # All retries exhausted
         if last_exception:
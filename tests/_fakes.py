@@ -0,0 +1,58 @@
+"""
+Lightweight hand-written test doubles.
+
+These record calls in plain lists instead of going through Mock's call
+machinery, for tests that drive the real event handling path.
+"""
+
+import threading
+from typing import List, Optional
+
+from src.core.file_processor import ProcessingResult
+
+
+class FakeProcessor:
+    """Stand-in for FileProcessor that records the paths it is asked to process."""
+    
+    def __init__(self, result: Optional[ProcessingResult] = None):
+        self.calls: List[str] = []
+        self.called = threading.Event()
+        self.file_manager = None
+        self._result = result or ProcessingResult(success=True, file_path="", processing_time=0.0)
+    
+    def process_file(self, file_path: str) -> ProcessingResult:
+        self.calls.append(file_path)
+        self.called.set()
+        return self._result
+
+
+class NullLogger:
+    """Stand-in for LoggerService that discards every message.
+    
+    For tests that never inspect log output, so logging costs nothing.
+    """
+    
+    def log_info(self, message: str) -> None:
+        pass
+    
+    def log_error(self, message: str, exception: Optional[Exception] = None) -> None:
+        pass
+
+
+class FakeClock:
+    """Stand-in for time.monotonic/time.sleep on a virtual timeline.
+    
+    sleep() returns immediately but advances the clock, and records the
+    requested delay so tests can check a backoff schedule.
+    """
+    
+    def __init__(self, start: float = 0.0):
+        self.now = start
+        self.sleeps: List[float] = []
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
@@ -2,16 +2,39 @@
 Unit tests for FileManager class.
 """
 
+import errno
 import os
+import stat
 import tempfile
 import shutil
 from pathlib import Path
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, Mock, DEFAULT
 
 from src.core.file_manager import FileManager
 
 
+def _quick_unlink(path):
+    """Remove a test file via os.unlink, skipping Path.unlink's extra checks."""
+    os.unlink(os.fspath(path))
+
+
+def _cross_device_error():
+    """The OSError os.replace raises when source and destination are on different filesystems."""
+    return OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+@pytest.fixture(scope="session")
+def symlinks_supported(tmp_path_factory):
+    """Probe once per session whether the filesystem allows creating symlinks."""
+    probe_dir = tmp_path_factory.mktemp("symlink_probe")
+    try:
+        (probe_dir / "link").symlink_to(probe_dir)
+        return True
+    except OSError:
+        return False
+
+
 class TestFileManager:
     """Test cases for FileManager class."""
     
@@ -82,13 +105,14 @@ class TestFileManager:
         assert not test_file.exists()
         
         # Verify file exists in saved folder with preserved structure
-        saved_file = self.saved_folder / "subfolder" / "deep" / "nested_test.txt"
+        saved_subfolder = self.saved_folder / "subfolder"
+        saved_file = saved_subfolder / "deep" / "nested_test.txt"
         assert saved_file.exists()
         assert saved_file.read_text() == "nested content"
         
         # Verify folder structure was created
-        assert (self.saved_folder / "subfolder").exists()
-        assert (self.saved_folder / "subfolder" / "deep").exists()
+        assert saved_subfolder.exists()
+        assert (saved_subfolder / "deep").exists()
     
     def test_move_to_error_simple_file(self):
         """Test moving a file from source root to error folder."""
@@ -126,13 +150,14 @@ class TestFileManager:
         assert not test_file.exists()
         
         # Verify file exists in error folder with preserved structure
-        error_file = self.error_folder / "errors" / "critical" / "critical_error.txt"
+        error_subfolder = self.error_folder / "errors"
+        error_file = error_subfolder / "critical" / "critical_error.txt"
         assert error_file.exists()
         assert error_file.read_text() == "critical error content"
         
         # Verify folder structure was created
-        assert (self.error_folder / "errors").exists()
-        assert (self.error_folder / "errors" / "critical").exists()
+        assert error_subfolder.exists()
+        assert (error_subfolder / "critical").exists()
     
     def test_preserve_folder_structure_relative_path(self):
         """Test folder structure preservation calculation."""
@@ -211,13 +236,13 @@ class TestFileManager:
         
         assert relative_path is None
     
-    @patch('shutil.copy2')
-    @patch('shutil.move')
-    def test_move_to_saved_file_operation_error(self, mock_move, mock_copy2):
+    @patch('shutil.copyfile')
+    @patch('os.replace')
+    def test_move_to_saved_file_operation_error(self, mock_replace, mock_copyfile):
         """Test error handling when both atomic move and copy fallback fail."""
-        # Mock both shutil.move and shutil.copy2 to raise exceptions
-        mock_move.side_effect = OSError("Permission denied")
-        mock_copy2.side_effect = OSError("Permission denied")
+        # Cross-device rename forces the copy fallback, which also fails
+        mock_replace.side_effect = _cross_device_error()
+        mock_copyfile.side_effect = OSError("Permission denied")
         
         # Create test file
         test_file = self.source_folder / "test.txt"
@@ -231,13 +256,13 @@ class TestFileManager:
         # Original file should still exist since move failed
         assert test_file.exists()
     
-    @patch('shutil.copy2')
-    @patch('shutil.move')
-    def test_move_to_error_file_operation_error(self, mock_move, mock_copy2):
+    @patch('shutil.copyfile')
+    @patch('os.replace')
+    def test_move_to_error_file_operation_error(self, mock_replace, mock_copyfile):
         """Test error handling when both atomic move and copy fallback fail."""
-        # Mock both shutil.move and shutil.copy2 to raise exceptions
-        mock_move.side_effect = OSError("Disk full")
-        mock_copy2.side_effect = OSError("Disk full")
+        # Cross-device rename forces the copy fallback, which also fails
+        mock_replace.side_effect = _cross_device_error()
+        mock_copyfile.side_effect = OSError("Disk full")
         
         # Create test file
         test_file = self.source_folder / "test.txt"
@@ -377,24 +402,77 @@ class TestFileManagerCoverageEnhancement:
             with pytest.raises(PermissionError, match="Destination directory is not writable"):
                 self.file_manager._validate_destination_writable(self.saved_folder)
     
-    def test_atomic_move_copy_delete_fallback_success(self):
-        """Test atomic move fallback to copy+delete when move fails."""
+    def test_atomic_move_same_filesystem_renames(self):
+        """Test atomic move is a single rename when no fallback is needed."""
+        test_file = self.source_folder / "atomic_rename_test.txt"
+        test_file.write_text("test content")
+        
+        dest_file = self.saved_folder / "atomic_rename_test.txt"
+        
+        with patch('shutil.copyfile') as mock_copy:
+            self.file_manager._atomic_move(test_file, dest_file)
+        
+        mock_copy.assert_not_called()
+        assert dest_file.read_text() == "test content"
+        assert not test_file.exists()
+    
+    def test_atomic_move_cross_device_staged_rename(self):
+        """Test cross-device move copies to a temp file and renames it into place."""
         # Create test file
         test_file = self.source_folder / "atomic_test.txt"
         test_file.write_text("test content")
         
         dest_file = self.saved_folder / "atomic_test.txt"
         
-        # Mock shutil.move to fail, but copy2 to succeed
-        with patch('shutil.move', side_effect=OSError("Move failed")), \
-             patch('shutil.copy2') as mock_copy, \
-             patch.object(Path, 'unlink') as mock_unlink:
-            
+        # First rename crosses devices; the staged rename goes to the real os.replace
+        with patch('os.replace', side_effect=[_cross_device_error(), DEFAULT],
+                   wraps=os.replace) as mock_replace:
             self.file_manager._atomic_move(test_file, dest_file)
+        
+        # Verify the copy was staged next to the destination and renamed over it
+        staged_src, staged_dst = mock_replace.call_args_list[1].args
+        assert Path(staged_src).parent == dest_file.parent
+        assert Path(staged_src).name.startswith(".tmp_move_")
+        assert staged_dst == str(dest_file)
+        
+        assert dest_file.read_text() == "test content"
+        assert not test_file.exists()
+        assert not Path(staged_src).exists()
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX chmod semantics")
+    @pytest.mark.skipif(hasattr(os, "geteuid") and os.geteuid() == 0,
+                        reason="root can open read-only files for writing")
+    def test_atomic_move_cross_device_read_only_source(self):
+        """Test a read-only file is moved across devices and keeps its mode."""
+        test_file = self.source_folder / "read_only.txt"
+        test_file.write_text("test content")
+        test_file.chmod(0o444)
+        
+        dest_file = self.saved_folder / "read_only.txt"
+        
+        with patch('os.replace', side_effect=[_cross_device_error(), DEFAULT],
+                   wraps=os.replace):
+            self.file_manager._atomic_move(test_file, dest_file)
+        
+        assert dest_file.read_text() == "test content"
+        assert stat.S_IMODE(dest_file.stat().st_mode) == 0o444
+        assert not test_file.exists()
+    
+    def test_atomic_move_other_os_error_not_copied(self):
+        """Test that move errors other than EXDEV are raised without a copy fallback."""
+        test_file = self.source_folder / "atomic_error_test.txt"
+        test_file.write_text("test content")
+        
+        dest_file = self.saved_folder / "atomic_error_test.txt"
+        
+        with patch('os.replace', side_effect=PermissionError("Access denied")), \
+             patch('shutil.copyfile') as mock_copy:
             
-            # Verify copy2 was called and unlink was called
-            mock_copy.assert_called_once_with(str(test_file), str(dest_file))
-            mock_unlink.assert_called_once()
+            with pytest.raises(PermissionError, match="Access denied"):
+                self.file_manager._atomic_move(test_file, dest_file)
+        
+        mock_copy.assert_not_called()
+        assert test_file.exists()
     
     def test_atomic_move_copy_delete_fallback_copy_fails(self):
         """Test atomic move fallback when both move and copy fail."""
@@ -404,12 +482,16 @@ class TestFileManagerCoverageEnhancement:
         
         dest_file = self.saved_folder / "atomic_fail_test.txt"
         
-        # Mock both shutil.move and shutil.copy2 to fail
-        with patch('shutil.move', side_effect=OSError("Move failed")), \
-             patch('shutil.copy2', side_effect=OSError("Copy failed")):
+        # Rename crosses devices and the staging copy fails
+        with patch('os.replace', side_effect=_cross_device_error()), \
+             patch('shutil.copyfile', side_effect=OSError("Copy failed")):
             
             with pytest.raises(OSError, match="Copy failed"):
                 self.file_manager._atomic_move(test_file, dest_file)
+        
+        # Nothing is left behind in the destination folder
+        assert list(self.saved_folder.iterdir()) == []
+        assert test_file.exists()
     
     def test_atomic_move_copy_delete_fallback_cleanup_on_failure(self):
         """Test atomic move cleanup when copy succeeds but delete fails."""
@@ -419,11 +501,10 @@ class TestFileManagerCoverageEnhancement:
         
         dest_file = self.saved_folder / "cleanup_test.txt"
         
-        # Mock shutil.move to fail, copy2 to succeed, but unlink to fail
-        with patch('shutil.move', side_effect=OSError("Move failed")), \
-             patch('shutil.copy2'), \
-             patch.object(Path, 'unlink', side_effect=OSError("Delete failed")), \
-             patch.object(Path, 'exists', return_value=True) as mock_exists:
+        # Rename crosses devices, staged copy lands, but deleting the original fails
+        with patch('os.replace', side_effect=[_cross_device_error(), DEFAULT],
+                   wraps=os.replace), \
+             patch.object(Path, 'unlink', side_effect=OSError("Delete failed")):
             
             with pytest.raises(OSError, match="Delete failed"):
                 self.file_manager._atomic_move(test_file, dest_file)
@@ -613,13 +694,9 @@ class TestFileManagerEmptyFolderDetection:
     def test_check_folder_contents_recursive_deeply_nested_empty(self):
         """Test recursive folder content checking with deeply nested empty structure."""
         deep_folder = self.source_folder / "deep"
-        deep_folder.mkdir()
         
         # Create deeply nested empty structure
-        current = deep_folder
-        for i in range(5):
-            current = current / f"level{i}"
-            current.mkdir()
+        deep_folder.joinpath(*[f"level{i}" for i in range(5)]).mkdir(parents=True)
         
         result = self.file_manager._check_folder_contents_recursive(deep_folder)
         
@@ -628,13 +705,10 @@ class TestFileManagerEmptyFolderDetection:
     def test_check_folder_contents_recursive_deeply_nested_with_file(self):
         """Test recursive folder content checking with file at deep level."""
         deep_folder = self.source_folder / "deep_with_file"
-        deep_folder.mkdir()
         
         # Create deeply nested structure with file at the end
-        current = deep_folder
-        for i in range(3):
-            current = current / f"level{i}"
-            current.mkdir()
+        current = deep_folder.joinpath(*[f"level{i}" for i in range(3)])
+        current.mkdir(parents=True)
         
         # Add file at deepest level
         (current / "deep_file.txt").write_text("deep content")
@@ -811,13 +885,14 @@ class TestEmptyFolderHandling:
         assert not nested_empty.exists()
         
         # Verify folder exists in error folder with preserved structure
-        error_folder_path = self.error_folder / "level1" / "level2" / "empty_nested"
+        error_level1 = self.error_folder / "level1"
+        error_folder_path = error_level1 / "level2" / "empty_nested"
         assert error_folder_path.exists()
         assert error_folder_path.is_dir()
         
         # Verify intermediate directories were created
-        assert (self.error_folder / "level1").exists()
-        assert (self.error_folder / "level1" / "level2").exists()
+        assert error_level1.exists()
+        assert (error_level1 / "level2").exists()
     
     def test_move_empty_folder_to_error_fails_for_non_empty_folder(self):
         """Test that moving non-empty folder to error folder fails."""
@@ -1084,14 +1159,16 @@ class TestEmptyFolderHandling:
         assert result is True
         
         # Verify folder was moved with full structure preservation
-        expected_error_path = self.error_folder / "level1" / "level2" / "level3" / "empty"
+        error_level1 = self.error_folder / "level1"
+        error_level2 = error_level1 / "level2"
+        expected_error_path = error_level2 / "level3" / "empty"
         assert expected_error_path.exists()
         assert expected_error_path.is_dir()
         
         # Verify all intermediate directories were created
-        assert (self.error_folder / "level1").exists()
-        assert (self.error_folder / "level1" / "level2").exists()
-        assert (self.error_folder / "level1" / "level2" / "level3").exists()
+        assert error_level1.exists()
+        assert error_level2.exists()
+        assert (error_level2 / "level3").exists()
         
         # Verify original folder no longer exists
         assert not deep_empty_folder.exists()
@@ -1127,6 +1204,17 @@ class TestEmptyFolderHandling:
         result = self.file_manager.should_process_as_empty_folder(str(empty_folder))
         assert result is True
     
+    def test_should_process_as_empty_folder_known_empty_skips_listing(self):
+        """Test should_process_as_empty_folder trusts the caller's emptiness check."""
+        empty_folder = self.source_folder / "listed_empty"
+        empty_folder.mkdir()
+        
+        with patch.object(self.file_manager, 'is_completely_empty_folder') as mock_check:
+            result = self.file_manager.should_process_as_empty_folder(str(empty_folder), known_empty=True)
+        
+        assert result is True
+        mock_check.assert_not_called()
+    
     def test_should_process_as_empty_folder_files_in_saved(self):
         """Test should_process_as_empty_folder prevents processing when files exist in saved folder."""
         # Create empty source folder
@@ -1273,16 +1361,17 @@ class TestEmptyFolderHandling:
         # Create a mixed structure with files and empty folders
         
         # Create file that will be processed
-        test_file = self.source_folder / "subfolder" / "test.txt"
-        test_file.parent.mkdir(parents=True)
+        subfolder = self.source_folder / "subfolder"
+        test_file = subfolder / "test.txt"
+        subfolder.mkdir(parents=True)
         test_file.write_text("test content")
         
         # Create completely empty folder in same structure
-        empty_folder = self.source_folder / "subfolder" / "empty"
+        empty_folder = subfolder / "empty"
         empty_folder.mkdir()
         
         # Create folder with empty subfolders (should NOT be moved)
-        folder_with_subs = self.source_folder / "subfolder" / "with_subs"
+        folder_with_subs = subfolder / "with_subs"
         folder_with_subs.mkdir()
         (folder_with_subs / "empty_sub").mkdir()
         
@@ -1339,10 +1428,10 @@ class TestEmptyFolderHandling:
         nested_folder = self.source_folder / "level1" / "level2"
         nested_folder.mkdir(parents=True)
         test_file = nested_folder / "test.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal by deleting it
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Run cleanup
         removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
@@ -1355,12 +1444,10 @@ class TestEmptyFolderHandling:
         assert nested_folder.resolve() in removed_paths
         assert nested_folder.parent.resolve() in removed_paths
         
-        # Verify folders were actually removed
-        assert not nested_folder.exists()
-        assert not nested_folder.parent.exists()
-        
-        # Source folder should still exist
-        assert self.source_folder.exists()
+        # Verify folders were actually removed; listing the source folder
+        # also proves it still exists
+        source_entries = {entry.name for entry in os.scandir(self.source_folder)}
+        assert "level1" not in source_entries
     
     def test_cleanup_empty_folders_stops_at_non_empty_folder(self):
         """Test cleanup stops when encountering a non-empty folder."""
@@ -1371,12 +1458,12 @@ class TestEmptyFolderHandling:
         level3.mkdir(parents=True)
         
         # Add files to different levels
-        (level1 / "keep.txt").write_text("keep this")
+        (level1 / "keep.txt").touch()
         test_file = level3 / "remove.txt"
-        test_file.write_text("remove this")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Run cleanup
         removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
@@ -1390,20 +1477,20 @@ class TestEmptyFolderHandling:
         assert level2.resolve() in removed_paths
         assert level1.resolve() not in removed_paths
         
-        # Verify correct folders were removed
-        assert not level3.exists()
-        assert not level2.exists()
-        assert level1.exists()  # Should still exist because it has keep.txt
-        assert (level1 / "keep.txt").exists()
+        # Verify correct folders were removed: level1 survives with keep.txt only
+        assert "level1" in {entry.name for entry in os.scandir(level1.parent)}
+        level1_entries = {entry.name for entry in os.scandir(level1)}
+        assert "keep.txt" in level1_entries
+        assert "level2" not in level1_entries
     
     def test_cleanup_empty_folders_stops_at_source_root(self):
         """Test cleanup never removes the source root folder."""
         # Create file directly in source folder
         test_file = self.source_folder / "test.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Run cleanup
         removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
@@ -1428,10 +1515,10 @@ class TestEmptyFolderHandling:
         
         # Add file only at deepest level
         test_file = level3 / "test.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Run cleanup
         removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
@@ -1456,27 +1543,21 @@ class TestEmptyFolderHandling:
         nested_folder = self.source_folder / "protected" / "subfolder"
         nested_folder.mkdir(parents=True)
         test_file = nested_folder / "test.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
-        # Mock rmdir to raise PermissionError on first call
-        original_rmdir = Path.rmdir
-        call_count = 0
+        # Mock rmdir to raise PermissionError on first call, then defer to the real rmdir
+        rmdir_mock = Mock(side_effect=[PermissionError("Access denied")] + [DEFAULT] * 10,
+                          wraps=Path.rmdir)
         
-        def mock_rmdir(self):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise PermissionError("Access denied")
-            return original_rmdir(self)
-        
-        with patch.object(Path, 'rmdir', mock_rmdir):
+        with patch.object(Path, 'rmdir', lambda self: rmdir_mock(self)):
             removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
         
         # Should stop at first permission error
         assert len(removed_folders) == 0
+        assert rmdir_mock.call_count == 1
         
         # Folders should still exist due to permission error
         assert nested_folder.exists()
@@ -1486,7 +1567,7 @@ class TestEmptyFolderHandling:
         # Create file outside source folder
         external_file = Path(self.temp_dir) / "external" / "file.txt"
         external_file.parent.mkdir()
-        external_file.write_text("content")
+        external_file.touch()
         
         # Run cleanup on external file
         removed_folders = self.file_manager.cleanup_empty_folders(str(external_file))
@@ -1497,33 +1578,32 @@ class TestEmptyFolderHandling:
         # External folder should still exist
         assert external_file.parent.exists()
     
-    def test_cleanup_empty_folders_deeply_nested_structure(self):
-        """Test cleanup with deeply nested folder structure."""
-        # Create deeply nested structure
-        current = self.source_folder
-        for i in range(5):
-            current = current / f"level{i}"
-            current.mkdir()
+    @pytest.mark.parametrize("folder_names", [
+        [f"level{i}" for i in range(5)],
+        [f"very_long_path_level_{i:02d}" for i in range(10)],
+        ["folder with spaces", "folder-with-dashes", "folder_with_underscores"],
+    ], ids=["deeply_nested_structure", "very_long_path", "special_characters_in_path"])
+    def test_cleanup_empty_folders_nested_levels(self, folder_names):
+        """Test cleanup removes every level of an emptied nested folder structure."""
+        # Create nested structure from a single joined string (no intermediate Path objects)
+        deepest = os.path.join(str(self.source_folder), *folder_names)
+        os.makedirs(deepest)
         
         # Add file at deepest level
-        test_file = current / "deep.txt"
-        test_file.write_text("deep content")
+        test_file = os.path.join(deepest, "test file.txt")
+        Path(test_file).touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Run cleanup
-        removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
-        
-        # Should remove all 5 levels
-        assert len(removed_folders) == 5
+        removed_folders = self.file_manager.cleanup_empty_folders(test_file)
         
-        # Verify all nested folders were removed
-        level0 = self.source_folder / "level0"
-        assert not level0.exists()
+        # Should remove every level
+        assert len(removed_folders) == len(folder_names)
         
-        # Source folder should still exist
-        assert self.source_folder.exists()
+        # Verify all nested folders were removed while the source folder remains
+        assert folder_names[0] not in {entry.name for entry in os.scandir(self.source_folder)}
     
     def test_cleanup_empty_folders_os_error_during_cleanup(self):
         """Test cleanup handles OS errors during folder removal."""
@@ -1531,10 +1611,10 @@ class TestEmptyFolderHandling:
         nested_folder = self.source_folder / "error_test" / "subfolder"
         nested_folder.mkdir(parents=True)
         test_file = nested_folder / "test.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Mock rmdir to raise OSError
         with patch.object(Path, 'rmdir', side_effect=OSError("Disk error")):
@@ -1548,7 +1628,7 @@ class TestEmptyFolderHandling:
         nested_path = self.source_folder / "sub" / "nested"
         nested_path.mkdir(parents=True)
         
-        result = self.file_manager._is_path_under_source(nested_path, self.source_folder.resolve())
+        result = self.file_manager._is_path_under_source(nested_path.resolve(), self.source_folder.resolve())
         
         assert result is True
     
@@ -1557,7 +1637,7 @@ class TestEmptyFolderHandling:
         external_path = Path(self.temp_dir) / "external"
         external_path.mkdir()
         
-        result = self.file_manager._is_path_under_source(external_path, self.source_folder)
+        result = self.file_manager._is_path_under_source(external_path.resolve(), self.source_folder.resolve())
         
         assert result is False
     
@@ -1567,15 +1647,27 @@ class TestEmptyFolderHandling:
         
         assert result is True
     
+    def test_is_path_under_source_no_resolution(self):
+        """Test path validation does not touch the filesystem for resolved inputs."""
+        source = self.source_folder.resolve()
+        nested_path = source / "sub" / "nested"
+        sibling_path = source.parent / (source.name + "_sibling")
+        
+        with patch.object(Path, 'resolve', side_effect=AssertionError("resolve called")):
+            assert self.file_manager._is_path_under_source(nested_path, source) is True
+            assert self.file_manager._is_path_under_source(source, source) is True
+            # Sharing a string prefix is not enough to be under the source folder
+            assert self.file_manager._is_path_under_source(sibling_path, source) is False
+    
     def test_cleanup_empty_folders_exception_handling(self):
         """Test cleanup handles unexpected exceptions gracefully."""
         nested_folder = self.source_folder / "exception_test"
         nested_folder.mkdir()
         test_file = nested_folder / "test.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Mock Path.resolve to raise an exception early in the process
         original_resolve = Path.resolve
@@ -1590,14 +1682,39 @@ class TestEmptyFolderHandling:
         # Should handle exception gracefully
         assert len(removed_folders) == 0
     
+    def test_resolved_source_cached(self):
+        """Test cleanup reuses the source folder resolved in __init__."""
+        nested_folder = self.source_folder / "cached" / "deeper"
+        nested_folder.mkdir(parents=True)
+        test_file = nested_folder / "test.txt"
+        test_file.touch()
+        
+        # Simulate file removal
+        _quick_unlink(test_file)
+        
+        # Record every path resolved during cleanup
+        original_resolve = Path.resolve
+        resolved_paths = []
+        def recording_resolve(self, *args, **kwargs):
+            resolved_paths.append(Path(str(self)))
+            return original_resolve(self, *args, **kwargs)
+        
+        with patch.object(Path, 'resolve', recording_resolve):
+            removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
+        
+        # Cleanup still works, but the source root is never re-resolved
+        assert len(removed_folders) == 2
+        assert self.file_manager.source_folder not in resolved_paths
+        assert self.source_folder not in resolved_paths
+    
     def test_cleanup_empty_folders_source_root_protection(self):
         """Test that source root folder is never removed even if empty."""
         # Create file directly in source root
         test_file = self.source_folder / "root_file.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Run cleanup - should not remove source root even though it's empty
         removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
@@ -1608,29 +1725,28 @@ class TestEmptyFolderHandling:
         # Source folder should still exist
         assert self.source_folder.exists()
     
-    def test_cleanup_empty_folders_symlink_handling(self):
+    def test_cleanup_empty_folders_symlink_handling(self, symlinks_supported):
         """Test cleanup handles symlinks correctly."""
+        if not symlinks_supported:
+            pytest.skip("Symlinks not supported on this system")
+        
         # Create nested structure
         nested_folder = self.source_folder / "symlink_test"
         nested_folder.mkdir()
         
         # Create symlink to external file
         external_file = Path(self.temp_dir) / "external.txt"
-        external_file.write_text("external")
+        external_file.touch()
         
         symlink_path = nested_folder / "symlink.txt"
-        try:
-            symlink_path.symlink_to(external_file)
-        except OSError:
-            # Skip test if symlinks not supported
-            pytest.skip("Symlinks not supported on this system")
+        symlink_path.symlink_to(external_file)
         
         # Create regular file in same folder
         test_file = nested_folder / "regular.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Remove regular file, leaving only symlink
-        test_file.unlink()
+        _quick_unlink(test_file)
         
         # Run cleanup - folder should not be removed because it contains symlink
         removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
@@ -1646,21 +1762,18 @@ class TestEmptyFolderHandling:
         nested_folder = self.source_folder / "concurrent_test"
         nested_folder.mkdir()
         test_file = nested_folder / "test.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
-        # Mock rmdir to simulate concurrent file creation (directory not empty error)
-        original_rmdir = Path.rmdir
-        def mock_rmdir(self):
-            if "concurrent_test" in str(self):
-                raise OSError("Directory not empty")  # Simulate concurrent file creation
-            return original_rmdir(self)
-        
-        with patch.object(Path, 'rmdir', mock_rmdir):
+        # Mock rmdir to simulate concurrent file creation (directory not empty error);
+        # concurrent_test is the only folder cleanup tries to remove
+        with patch.object(Path, 'rmdir', side_effect=OSError("Directory not empty")) as rmdir_mock:
             removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
         
+        assert rmdir_mock.call_count == 1
+        
         # Should handle the race condition gracefully - no folders removed due to concurrent creation
         assert len(removed_folders) == 0
     
@@ -1673,19 +1786,16 @@ class TestEmptyFolderHandling:
         level3.mkdir(parents=True)
         
         test_file = level3 / "test.txt"
-        test_file.write_text("content")
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
+        _quick_unlink(test_file)
         
-        # Mock rmdir to fail on level2 but succeed on level3
-        original_rmdir = Path.rmdir
-        def mock_rmdir(self):
-            if "perm2" in str(self) and "perm3" not in str(self):
-                raise PermissionError("Access denied to level2")
-            return original_rmdir(self)
+        # Mock rmdir to succeed on level3 (real rmdir) but fail on level2
+        rmdir_mock = Mock(side_effect=[DEFAULT, PermissionError("Access denied to level2")],
+                          wraps=Path.rmdir)
         
-        with patch.object(Path, 'rmdir', mock_rmdir):
+        with patch.object(Path, 'rmdir', lambda self: rmdir_mock(self)):
             removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
         
         # Should only remove level3, stop at level2 due to permission error
@@ -1694,85 +1804,35 @@ class TestEmptyFolderHandling:
         assert level3.resolve() in cleaned_paths
         
         # Verify level3 was removed but level2 and level1 still exist
-        assert not level3.exists()
-        assert level2.exists()
-        assert level1.exists()
-    
-    def test_cleanup_empty_folders_very_long_path(self):
-        """Test cleanup with very long nested path structure."""
-        # Create very deeply nested structure (10 levels)
-        current = self.source_folder
-        for i in range(10):
-            current = current / f"very_long_path_level_{i:02d}"
-            current.mkdir()
-        
-        test_file = current / "deep_file.txt"
-        test_file.write_text("very deep content")
+        assert "perm1" in {entry.name for entry in os.scandir(level1.parent)}
+        assert "perm3" not in {entry.name for entry in os.scandir(level2)}
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX chmod semantics")
+    @pytest.mark.skipif(hasattr(os, "geteuid") and os.geteuid() == 0,
+                        reason="root bypasses directory permissions")
+    @pytest.mark.parametrize("parent_mode", [0o555, 0o444])
+    def test_cleanup_empty_folders_readonly_folder(self, request, parent_mode):
+        """Test cleanup stops when a read-only parent blocks folder removal."""
+        # Create nested structure
+        readonly_parent = self.source_folder / "readonly_test"
+        nested_folder = readonly_parent / "child"
+        nested_folder.mkdir(parents=True)
+        test_file = nested_folder / "test.txt"
+        test_file.touch()
         
         # Simulate file removal
-        test_file.unlink()
-        
-        # Run cleanup
-        removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
-        
-        # Should remove all 10 levels
-        assert len(removed_folders) == 10
-        
-        # Verify all levels were removed
-        check_path = self.source_folder / "very_long_path_level_00"
-        assert not check_path.exists()
-    
-    def test_cleanup_empty_folders_special_characters_in_path(self):
-        """Test cleanup with special characters in folder names."""
-        # Create folders with special characters
-        special_folder = self.source_folder / "folder with spaces" / "folder-with-dashes" / "folder_with_underscores"
-        special_folder.mkdir(parents=True)
+        _quick_unlink(test_file)
         
-        test_file = special_folder / "test file.txt"
-        test_file.write_text("content")
-        
-        # Simulate file removal
-        test_file.unlink()
+        # Make the parent read-only so rmdir of the child is refused;
+        # restore permissions so teardown can remove the tree
+        readonly_parent.chmod(parent_mode)
+        request.addfinalizer(lambda: os.chmod(readonly_parent, 0o755))
         
         # Run cleanup
         removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
         
-        # Should remove all 3 levels with special characters
-        assert len(removed_folders) == 3
-        
-        # Verify folders were actually removed
-        assert not special_folder.exists()
-        assert not special_folder.parent.exists()
-        assert not special_folder.parent.parent.exists()
-    
-    def test_cleanup_empty_folders_readonly_folder(self):
-        """Test cleanup behavior with read-only folders."""
-        # Create nested structure
-        nested_folder = self.source_folder / "readonly_test"
-        nested_folder.mkdir()
-        test_file = nested_folder / "test.txt"
-        test_file.write_text("content")
-        
-        # Simulate file removal
-        test_file.unlink()
-        
-        # Make folder read-only (this might cause rmdir to fail)
-        try:
-            nested_folder.chmod(0o444)  # Read-only
-            
-            # Run cleanup
-            removed_folders = self.file_manager.cleanup_empty_folders(str(test_file))
-            
-            # Behavior depends on system - might succeed or fail
-            # Just verify it doesn't crash
-            assert isinstance(removed_folders, list)
-            
-        finally:
-            # Restore permissions for cleanup
-            try:
-                nested_folder.chmod(0o755)
-            except:
-                pass
+        # Nothing can be removed below a read-only parent
+        assert removed_folders == []
 
 
 class TestFileManagerCompletelyEmptyFolderDetection:
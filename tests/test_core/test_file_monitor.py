@@ -6,87 +6,257 @@ integration with FileProcessor, and error scenarios.
 """
 
 import os
-import time
-import tempfile
+import stat
+import sys
+import contextlib
 import threading
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, mock_open, call
+from unittest.mock import Mock, patch, call, create_autospec, DEFAULT
 import pytest
 
+from watchdog.events import FileCreatedEvent, FileModifiedEvent
+
 from src.core.file_monitor import FileMonitor, FileEventHandler
 from src.core.file_processor import FileProcessor, ProcessingResult
 from src.services.logger_service import LoggerService
+from tests._fakes import FakeClock, FakeProcessor, NullLogger
+
+
+# Successful processing result shared by tests that only check .success;
+# FileMonitor never mutates the results it gets back
+_SUCCESS_TEMPLATE = ProcessingResult(success=True, file_path="")
+
+
+def _stat_result(size, mtime_ns):
+    """Build an os.stat_result for a regular file with the given size and mtime."""
+    return os.stat_result(
+        (stat.S_IFREG | 0o644, 0, 0, 1, 0, 0, size, 0, 0, 0),
+        {'st_mtime_ns': mtime_ns}
+    )
+
+
+def _touch(path, data=b"content"):
+    """Create a small file with a single write(2), bypassing the io stack."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="module")
+def mock_processor_template():
+    """Spec'd FileProcessor mock, built once per module."""
+    return create_autospec(FileProcessor, instance=True, spec_set=True)
+
+
+@pytest.fixture(scope="module")
+def mock_logger_template():
+    """Spec'd LoggerService mock, built once per module."""
+    return create_autospec(LoggerService, instance=True, spec_set=True)
+
+
+@pytest.fixture
+def mock_processor(mock_processor_template):
+    """The shared FileProcessor mock with calls and configured behaviour cleared."""
+    mock_processor_template.reset_mock(return_value=True, side_effect=True)
+    return mock_processor_template
+
+
+@pytest.fixture
+def mock_logger(mock_logger_template):
+    """The shared LoggerService mock with calls and configured behaviour cleared."""
+    mock_logger_template.reset_mock(return_value=True, side_effect=True)
+    return mock_logger_template
+
+
+@pytest.fixture(scope="session")
+def shared_dir(tmp_path_factory):
+    """Session-wide source folder for tests that never write into it."""
+    return tmp_path_factory.mktemp("src")
 
 
 class TestFileEventHandler:
     """Test cases for FileEventHandler class."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_processor, mock_logger):
         """Set up test fixtures."""
-        self.mock_processor = Mock(spec=FileProcessor)
-        self.mock_logger = Mock(spec=LoggerService)
+        self.mock_processor = mock_processor
+        self.mock_logger = mock_logger
         self.handler = FileEventHandler(self.mock_processor, self.mock_logger)
+        yield
+        # Don't let a held burst's timer reach the shared mocks after the test
+        self.handler.flush_pending()
     
-    def test_on_created_processes_file_successfully(self):
-        """Test that file creation events trigger successful processing."""
+    @pytest.fixture(autouse=True)
+    def stub_fs(self):
+        """Stub the stability and readiness checks on the handler.
+        
+        Both checks' own behaviour is covered directly in
+        TestFileMonitorCoverageEnhancement; here they just report their outcome.
+        """
+        with contextlib.ExitStack() as stack:
+            stubs = {
+                'stable': stack.enter_context(
+                    patch.object(FileEventHandler, '_wait_for_file_stability', return_value=True)
+                ),
+                'ready': stack.enter_context(
+                    patch.object(FileEventHandler, '_validate_file_ready', return_value=True)
+                ),
+                'sleep': stack.enter_context(patch('time.sleep')),
+            }
+            yield stubs
+    
+    @pytest.mark.parametrize("result,exc,expect_error", [
+        (ProcessingResult(success=True, file_path="/test/path/file.txt", processing_time=0.5),
+         None, False),
+        (ProcessingResult(success=False, file_path="/test/path/file.txt",
+                          error_message="Processing failed", processing_time=0.2),
+         None, True),
+        (None, Exception("Unexpected error"), True),
+    ], ids=["success", "processing_failure", "processing_exception"])
+    def test_on_created_outcomes(self, result, exc, expect_error):
+        """Test that file creation events are processed and their outcome is logged."""
         # Arrange
         mock_event = Mock()
         mock_event.is_directory = False
         mock_event.src_path = "/test/path/file.txt"
         
-        # Mock successful processing
-        success_result = ProcessingResult(
+        if exc:
+            self.mock_processor.process_file.side_effect = exc
+        else:
+            self.mock_processor.process_file.return_value = result
+        
+        # Act
+        self.handler.on_created(mock_event)
+        
+        # Assert
+        self.mock_logger.log_info.assert_any_call("New file detected: /test/path/file.txt")
+        # With retry logic, a raising processor may be called multiple times
+        assert self.mock_processor.process_file.call_args[0][0] == "/test/path/file.txt"
+        assert self.mock_logger.log_error.called == expect_error
+    
+    @pytest.fixture
+    def clock(self):
+        """Run the handler's debounce windows on a virtual clock."""
+        clock = FakeClock(start=100.0)
+        with patch('src.core.file_monitor.time', clock):
+            yield clock
+    
+    @pytest.fixture
+    def file_event(self):
+        """A creation event for a file the processor handles successfully."""
+        self.mock_processor.process_file.return_value = ProcessingResult(
             success=True,
             file_path="/test/path/file.txt",
-            processing_time=0.5
+            processing_time=0.1
         )
-        self.mock_processor.process_file.return_value = success_result
-        
-        with patch('os.path.exists', return_value=True), \
-             patch('os.path.isfile', return_value=True), \
-             patch('os.path.getsize', return_value=100), \
-             patch('builtins.open', mock_open(read_data=b"test")), \
-             patch('time.sleep'):
-            
-            # Act
-            self.handler.on_created(mock_event)
-            
-            # Assert
-            self.mock_logger.log_info.assert_any_call("New file detected: /test/path/file.txt")
-            self.mock_processor.process_file.assert_called_once_with("/test/path/file.txt")
-            self.mock_logger.log_info.assert_any_call(
-                "File processing completed successfully: /test/path/file.txt"
-            )
-    
-    def test_on_created_handles_processing_failure(self):
-        """Test that file creation events handle processing failures gracefully."""
-        # Arrange
         mock_event = Mock()
         mock_event.is_directory = False
         mock_event.src_path = "/test/path/file.txt"
+        return mock_event
+    
+    def test_on_created_debounces_burst(self, clock, file_event):
+        """Test that a burst of identical creation events is processed once."""
+        # Act
+        for _ in range(100):
+            self.handler.on_created(file_event)
+        self.handler.flush_pending()
         
-        # Mock failed processing
-        failure_result = ProcessingResult(
-            success=False,
-            file_path="/test/path/file.txt",
-            error_message="Processing failed",
-            processing_time=0.2
-        )
-        self.mock_processor.process_file.return_value = failure_result
+        # Assert
+        self.mock_processor.process_file.assert_called_once_with("/test/path/file.txt")
+        assert self.handler.get_stats()['duplicate_events_filtered'] == 99
+    
+    def test_on_created_debounces_burst_without_recent_files_filter(self, clock, file_event):
+        """Test that the debounce window alone coalesces a burst."""
+        # Act
+        with patch.object(self.handler, '_is_duplicate_event', return_value=False):
+            for _ in range(100):
+                self.handler.on_created(file_event)
+            self.handler.flush_pending()
         
-        with patch('os.path.exists', return_value=True), \
-             patch('os.path.isfile', return_value=True), \
-             patch('os.path.getsize', return_value=100), \
-             patch('builtins.open', mock_open(read_data=b"test")), \
-             patch('time.sleep'):
-            
-            # Act
-            self.handler.on_created(mock_event)
+        # Assert
+        self.mock_processor.process_file.assert_called_once_with("/test/path/file.txt")
+        assert self.handler.get_stats()['duplicate_events_filtered'] == 99
+    
+    def test_on_created_processes_file_recreated_after_processing(self, clock, file_event):
+        """Test that a new file created at a just-processed path is processed too."""
+        # Arrange - The new file has a different mtime from the processed one
+        signatures = [(4, 1_000), (4, 2_000)]
+        
+        # Act - The second file arrives well inside the debounce window
+        with patch.object(FileEventHandler, '_get_file_signature', side_effect=signatures):
+            self.handler.on_created(file_event)
+            self.handler.on_created(file_event)
+            self.handler.flush_pending()
+        
+        # Assert
+        assert self.mock_processor.process_file.call_count == 2
+        assert self.handler.get_stats()['duplicate_events_filtered'] == 0
+    
+    def test_on_created_processes_again_after_debounce_window(self, clock, file_event):
+        """Test that an event arriving after the debounce window is processed again."""
+        # Act
+        self.handler.on_created(file_event)
+        clock.sleep(2 * FileEventHandler.DEBOUNCE_WINDOW)
+        self.handler.on_created(file_event)
+        
+        # Assert
+        assert self.mock_processor.process_file.call_count == 2
+        assert self.handler.get_stats()['duplicate_events_filtered'] == 0
+    
+    def test_on_created_burst_ends_after_max_wait(self, clock, file_event):
+        """Test that a steady stream of events is processed again after DEBOUNCE_MAX_WAIT."""
+        # Act - 13 events 40ms apart; the 13th arrives 520ms into the burst
+        self.handler.on_created(file_event)
+        for _ in range(13):
+            clock.sleep(0.04)
+            self.handler.on_created(file_event)
+        self.handler.flush_pending()
+        
+        # Assert
+        assert self.mock_processor.process_file.call_count == 2
+        assert self.handler.get_stats()['duplicate_events_filtered'] == 12
+    
+    def test_on_modified_after_max_wait_settles_held_burst(self, clock, file_event):
+        """Test that a MODIFY arriving after DEBOUNCE_MAX_WAIT settles the held burst."""
+        # Arrange
+        modified_event = Mock(is_directory=False, src_path="/test/path/file.txt")
+        
+        # Act
+        with patch.object(FileEventHandler, '_get_file_signature',
+                          side_effect=[(4, 1_000), (4, 2_000)]):
+            self.handler.on_created(file_event)
+            self.handler.on_modified(modified_event)
+            clock.sleep(FileEventHandler.DEBOUNCE_MAX_WAIT)
+            self.handler.on_modified(modified_event)
+        
+        # Assert
+        assert self.mock_processor.process_file.call_count == 2
+        assert self.handler._pending == {}
+    
+    def test_flush_timer_processes_changed_file_once_quiet(self, file_event):
+        """Test that the flush timer settles a held burst without an explicit flush."""
+        # Arrange
+        second_call = threading.Event()
+        
+        def process(file_path):
+            if self.mock_processor.process_file.call_count == 2:
+                second_call.set()
+            return DEFAULT
+        
+        self.mock_processor.process_file.side_effect = process
+        
+        # Act
+        with patch.object(FileEventHandler, '_get_file_signature',
+                          side_effect=[(4, 1_000), (4, 2_000)]):
+            self.handler.on_created(file_event)
+            self.handler.on_created(file_event)
             
             # Assert
-            self.mock_logger.log_info.assert_any_call("New file detected: /test/path/file.txt")
-            self.mock_processor.process_file.assert_called_once_with("/test/path/file.txt")
-            self.mock_logger.log_error.assert_called_with("File processing failed: Processing failed")
+            assert second_call.wait(timeout=2)
+        assert self.handler._pending == {}
     
     def test_on_created_handles_directory_events(self):
         """Test that directory creation events are processed recursively."""
@@ -112,72 +282,46 @@ class TestFileEventHandler:
         ]
         self.mock_logger.log_info.assert_has_calls(expected_calls)
     
-    def test_on_created_handles_file_not_exists(self):
+    def test_on_created_handles_file_not_exists(self, stub_fs):
         """Test handling when file no longer exists after creation event."""
         # Arrange
         mock_event = Mock()
         mock_event.is_directory = False
         mock_event.src_path = "/test/path/file.txt"
+        stub_fs['stable'].return_value = False
         
-        with patch('os.path.exists', return_value=False), \
-             patch('time.sleep'):
-            
-            # Act
-            self.handler.on_created(mock_event)
-            
-            # Assert
-            self.mock_logger.log_info.assert_called_with("New file detected: /test/path/file.txt")
-            self.mock_processor.process_file.assert_not_called()
-            self.mock_logger.log_error.assert_called_with(
-                "File stability check failed: /test/path/file.txt"
-            )
-    
-    def test_on_created_handles_processing_exception(self):
-        """Test handling of unexpected exceptions during processing."""
-        # Arrange
-        mock_event = Mock()
-        mock_event.is_directory = False
-        mock_event.src_path = "/test/path/file.txt"
-        
-        # Mock processing exception
-        test_exception = Exception("Unexpected error")
-        self.mock_processor.process_file.side_effect = test_exception
+        # Act
+        self.handler.on_created(mock_event)
         
-        with patch('os.path.exists', return_value=True), \
-             patch('os.path.isfile', return_value=True), \
-             patch('os.path.getsize', return_value=100), \
-             patch('builtins.open', mock_open(read_data=b"test")), \
-             patch('time.sleep'):
-            
-            # Act
-            self.handler.on_created(mock_event)
-            
-            # Assert
-            self.mock_logger.log_info.assert_any_call("New file detected: /test/path/file.txt")
-            # With retry logic, process_file may be called multiple times
-            assert self.mock_processor.process_file.called
-            assert self.mock_processor.process_file.call_args[0][0] == "/test/path/file.txt"
-            # The error message format may have changed in the new implementation
-            assert self.mock_logger.log_error.called
+        # Assert
+        self.mock_logger.log_info.assert_called_with("New file detected: /test/path/file.txt")
+        self.mock_processor.process_file.assert_not_called()
+        self.mock_logger.log_error.assert_called_with(
+            "File stability check failed: /test/path/file.txt"
+        )
 
 
 class TestFileMonitor:
     """Test cases for FileMonitor class."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_processor, mock_logger):
         """Set up test fixtures."""
-        self.mock_processor = Mock(spec=FileProcessor)
-        self.mock_logger = Mock(spec=LoggerService)
-        
-        # Create temporary directory for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.source_folder = self.temp_dir
+        self.mock_processor = mock_processor
+        self.mock_logger = mock_logger
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _source_folder(self, shared_dir):
+        """Point the monitor at the shared read-only source folder."""
+        self.source_folder = str(shared_dir)
+    
+    @pytest.fixture(autouse=True)
+    def _patch_observer(self):
+        """Replace the watchdog Observer with a mock for every test in the class."""
+        with patch('src.core.file_monitor.Observer') as observer_class:
+            self.mock_observer = Mock()
+            observer_class.return_value = self.mock_observer
+            yield
     
     def test_init_with_valid_folder(self):
         """Test FileMonitor initialization with valid source folder."""
@@ -200,10 +344,10 @@ class TestFileMonitor:
         with pytest.raises(ValueError, match="Source folder does not exist"):
             FileMonitor(nonexistent_folder, self.mock_processor, self.mock_logger)
     
-    def test_init_with_file_instead_of_folder(self):
+    def test_init_with_file_instead_of_folder(self, tmp_path):
         """Test FileMonitor initialization with file path instead of folder."""
         # Arrange
-        test_file = os.path.join(self.temp_dir, "test_file.txt")
+        test_file = os.path.join(tmp_path, "test_file.txt")
         with open(test_file, 'w') as f:
             f.write("test content")
         
@@ -211,37 +355,28 @@ class TestFileMonitor:
         with pytest.raises(ValueError, match="Source path is not a directory"):
             FileMonitor(test_file, self.mock_processor, self.mock_logger)
     
-    @patch('src.core.file_monitor.Observer')
-    def test_start_monitoring_success(self, mock_observer_class):
+    def test_start_monitoring_success(self):
         """Test successful start of monitoring."""
         # Arrange
-        mock_observer = Mock()
-        mock_observer_class.return_value = mock_observer
-        
         monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        monitor.observer = mock_observer
         
         # Act
         monitor.start_monitoring()
         
         # Assert
-        mock_observer.schedule.assert_called_once()
-        mock_observer.start.assert_called_once()
+        self.mock_observer.schedule.assert_called_once()
+        self.mock_observer.start.assert_called_once()
         # Check that the monitoring started message was logged (could be among multiple log calls)
         self.mock_logger.log_info.assert_any_call(
             f"Started monitoring folder: {Path(self.source_folder).resolve()}"
         )
     
-    @patch('src.core.file_monitor.Observer')
-    def test_start_monitoring_failure(self, mock_observer_class):
+    def test_start_monitoring_failure(self):
         """Test handling of monitoring start failure."""
         # Arrange
-        mock_observer = Mock()
-        mock_observer.schedule.side_effect = Exception("Failed to schedule")
-        mock_observer_class.return_value = mock_observer
+        self.mock_observer.schedule.side_effect = Exception("Failed to schedule")
         
         monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        monitor.observer = mock_observer
         
         # Act & Assert
         with pytest.raises(RuntimeError, match="Failed to start file system monitoring"):
@@ -249,210 +384,268 @@ class TestFileMonitor:
         
         self.mock_logger.log_error.assert_called()
     
-    @patch('src.core.file_monitor.Observer')
-    def test_stop_monitoring_success(self, mock_observer_class):
+    def test_stop_monitoring_success(self):
         """Test successful stop of monitoring."""
         # Arrange
-        mock_observer = Mock()
-        mock_observer.is_alive.side_effect = [True, False]  # Alive before stop, not alive after join
-        mock_observer_class.return_value = mock_observer
+        self.mock_observer.is_alive.side_effect = iter([True, False]).__next__  # Alive before stop, not alive after join
         
         monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        monitor.observer = mock_observer
         
         # Act
-        monitor.stop_monitoring()
+        with patch.object(monitor.event_handler, 'flush_pending') as mock_flush:
+            monitor.stop_monitoring()
         
         # Assert
-        mock_observer.stop.assert_called_once()
-        mock_observer.join.assert_called_once_with(timeout=5.0)
+        self.mock_observer.stop.assert_called_once()
+        self.mock_observer.join.assert_called_once_with(timeout=5.0)
         self.mock_logger.log_info.assert_called_with("File system monitoring stopped")
+        mock_flush.assert_called_once_with()
     
-    @patch('src.core.file_monitor.Observer')
-    def test_stop_monitoring_timeout(self, mock_observer_class):
+    def test_stop_monitoring_timeout(self):
         """Test handling of monitoring stop timeout."""
         # Arrange
-        mock_observer = Mock()
-        mock_observer.is_alive.side_effect = [True, True]  # Still alive after join
-        mock_observer_class.return_value = mock_observer
+        self.mock_observer.is_alive.side_effect = iter([True, True]).__next__  # Still alive after join
         
         monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        monitor.observer = mock_observer
         
         # Act
         monitor.stop_monitoring()
         
         # Assert
-        mock_observer.stop.assert_called_once()
-        mock_observer.join.assert_called_once_with(timeout=5.0)
+        self.mock_observer.stop.assert_called_once()
+        self.mock_observer.join.assert_called_once_with(timeout=5.0)
         self.mock_logger.log_error.assert_called_with(
             "Observer did not stop gracefully within timeout"
         )
     
-    @patch('src.core.file_monitor.Observer')
-    def test_is_monitoring_active(self, mock_observer_class):
-        """Test is_monitoring when monitoring is active."""
+    @pytest.mark.parametrize("alive,expected", [(True, True), (False, False)],
+                             ids=["active", "inactive"])
+    def test_is_monitoring(self, alive, expected):
+        """Test is_monitoring reflects whether the observer thread is alive."""
         # Arrange
-        mock_observer = Mock()
-        mock_observer.is_alive.return_value = True
-        mock_observer_class.return_value = mock_observer
+        self.mock_observer.is_alive.return_value = alive
         
         monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        monitor.observer = mock_observer
         
         # Act & Assert
-        assert monitor.is_monitoring() is True
+        assert monitor.is_monitoring() is expected
     
-    @patch('src.core.file_monitor.Observer')
-    def test_is_monitoring_inactive(self, mock_observer_class):
-        """Test is_monitoring when monitoring is inactive."""
+    def test_wait_ready_returns_once_emitters_are_running(self):
+        """Test wait_ready returns True as soon as the observer and its emitters are alive."""
         # Arrange
-        mock_observer = Mock()
-        mock_observer.is_alive.return_value = False
-        mock_observer_class.return_value = mock_observer
+        emitter = Mock()
+        emitter.is_alive.return_value = True
+        self.mock_observer.is_alive.return_value = True
+        self.mock_observer.emitters = {emitter}
         
         monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        monitor.observer = mock_observer
         
         # Act & Assert
-        assert monitor.is_monitoring() is False
+        assert monitor.wait_ready(timeout=0) is True
     
-    @patch('src.core.file_monitor.Observer')
-    def test_context_manager(self, mock_observer_class):
+    def test_wait_ready_times_out_without_emitters(self):
+        """Test wait_ready gives up after the timeout when nothing is being watched."""
+        # Arrange
+        self.mock_observer.is_alive.return_value = True
+        self.mock_observer.emitters = set()
+        
+        monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
+        
+        # Act & Assert
+        assert monitor.wait_ready(timeout=0) is False
+    
+    def test_context_manager(self):
         """Test FileMonitor as context manager."""
         # Arrange
-        mock_observer = Mock()
-        mock_observer.is_alive.return_value = True
-        mock_observer_class.return_value = mock_observer
+        self.mock_observer.is_alive.return_value = True
         
         monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        monitor.observer = mock_observer
         
         # Act
         with monitor as m:
             assert m is monitor
-            mock_observer.schedule.assert_called_once()
-            mock_observer.start.assert_called_once()
+            self.mock_observer.schedule.assert_called_once()
+            self.mock_observer.start.assert_called_once()
         
         # Assert
-        mock_observer.stop.assert_called_once()
-        mock_observer.join.assert_called_once()
+        self.mock_observer.stop.assert_called_once()
+        self.mock_observer.join.assert_called_once()
 
 
+@pytest.mark.skipif(os.environ.get("SKIP_FS_INTEGRATION"), reason="fs integration disabled")
 class TestFileMonitorIntegration:
-    """Integration tests for FileMonitor with real file system events."""
+    """Integration tests for FileMonitor with real files on disk.
+    
+    Creation events are delivered straight to the event handler; only the
+    slow-marked smoke test exercises the real watchdog Observer.
+    """
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.mock_processor = Mock(spec=FileProcessor)
-        self.mock_logger = Mock(spec=LoggerService)
-        
-        # Create temporary directory for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.source_folder = self.temp_dir
-        
-        # Mock successful processing by default
-        success_result = ProcessingResult(
-            success=True,
-            file_path="",
-            processing_time=0.1
-        )
-        self.mock_processor.process_file.return_value = success_result
+        self.processor = FakeProcessor()
+        self.logger = NullLogger()
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _source_folder(self, tmp_path):
+        """Give each test its own source folder, cleaned up by pytest."""
+        self.source_folder = str(tmp_path)
     
     def test_real_file_creation_triggers_processing(self):
-        """Test that creating a real file triggers processing."""
+        """Test that a file creation event for a real file triggers processing."""
         # Arrange
-        monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        
-        # Start monitoring in a separate thread to avoid blocking
-        def start_monitoring():
-            monitor.start_monitoring()
-            time.sleep(2)  # Monitor for 2 seconds
-            monitor.stop_monitoring()
-        
-        monitor_thread = threading.Thread(target=start_monitoring)
-        monitor_thread.start()
-        
-        # Give monitor time to start
-        time.sleep(0.5)
-        
-        # Act - Create a file
+        monitor = FileMonitor(self.source_folder, self.processor, self.logger)
         test_file = os.path.join(self.source_folder, "test_file.txt")
         with open(test_file, 'w') as f:
             f.write("test content")
         
-        # Wait for processing
-        time.sleep(0.5)
-        
-        # Clean up
-        monitor_thread.join(timeout=3)
+        # Act - Deliver the creation event directly to the handler
+        with patch('src.core.file_monitor.time.sleep'):
+            monitor.event_handler.on_created(FileCreatedEvent(test_file))
         
         # Assert
-        self.mock_processor.process_file.assert_called()
-        # Verify the file path matches what we created (resolve both paths to handle symlinks)
-        call_args = self.mock_processor.process_file.call_args[0]
-        assert Path(call_args[0]).resolve() == Path(test_file).resolve()
+        assert len(self.processor.calls) == 1
+        assert Path(self.processor.calls[0]).resolve() == Path(test_file).resolve()
     
     def test_nested_folder_file_creation(self):
-        """Test that files created in nested folders are detected."""
+        """Test that file creation events for files in nested folders trigger processing."""
         # Arrange
         nested_dir = os.path.join(self.source_folder, "subdir", "nested")
         os.makedirs(nested_dir)
         
-        monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        
-        # Start monitoring
-        def start_monitoring():
-            monitor.start_monitoring()
-            time.sleep(2)
-            monitor.stop_monitoring()
+        monitor = FileMonitor(self.source_folder, self.processor, self.logger)
+        test_file = os.path.join(nested_dir, "nested_file.txt")
+        with open(test_file, 'w') as f:
+            f.write("nested content")
         
-        monitor_thread = threading.Thread(target=start_monitoring)
-        monitor_thread.start()
+        # Act - Deliver the creation event directly to the handler
+        with patch('src.core.file_monitor.time.sleep'):
+            monitor.event_handler.on_created(FileCreatedEvent(test_file))
         
-        # Give monitor time to start
-        time.sleep(0.5)
+        # Assert
+        assert len(self.processor.calls) == 1
+        assert Path(self.processor.calls[0]).resolve() == Path(test_file).resolve()
+    
+    def test_burst_creation_coalesces(self):
+        """Test that a burst of creation events dispatched for one file is processed once."""
+        # Arrange
+        monitor = FileMonitor(self.source_folder, self.processor, self.logger)
+        test_file = os.path.join(self.source_folder, "burst_file.txt")
+        with open(test_file, 'w') as f:
+            f.write("burst content")
+        
+        # Act - Go through dispatch() as the observer does, not on_created(),
+        # with the debounce window and stability delay on a virtual clock
+        with patch('src.core.file_monitor.time', FakeClock()):
+            for _ in range(500):
+                monitor.event_handler.dispatch(FileCreatedEvent(test_file))
+            monitor.event_handler.flush_pending()
+        
+        # Assert - The file is still on disk, so only debouncing stops the repeats
+        assert os.path.exists(test_file)
+        assert len(self.processor.calls) == 1
+        assert monitor.event_handler.get_stats()['duplicate_events_filtered'] == 499
+    
+    def test_coalesces_create_plus_modify(self):
+        """Test that an editor-style save (one CREATE, then several MODIFYs) is processed once."""
+        # Arrange
+        monitor = FileMonitor(self.source_folder, self.processor, self.logger)
+        test_file = os.path.join(self.source_folder, "saved_file.txt")
+        with open(test_file, 'w') as f:
+            f.write("saved content")
         
-        # Act - Create a file in nested directory
-        test_file = os.path.join(nested_dir, "nested_file.txt")
+        # Act
+        with patch('src.core.file_monitor.time', FakeClock()):
+            monitor.event_handler.dispatch(FileCreatedEvent(test_file))
+            for _ in range(5):
+                monitor.event_handler.dispatch(FileModifiedEvent(test_file))
+            monitor.event_handler.flush_pending()
+        
+        # Assert - The MODIFYs are held in the burst and dropped as repeats
+        stats = monitor.event_handler.get_stats()
+        assert self.processor.calls == [test_file]
+        assert stats['events_received'] == 6
+        assert stats['duplicate_events_filtered'] == 5
+    
+    def test_modify_after_processing_reprocesses_latest_content_once(self):
+        """Test that MODIFYs for a file rewritten after processing trigger one more call."""
+        # Arrange
+        monitor = FileMonitor(self.source_folder, self.processor, self.logger)
+        test_file = os.path.join(self.source_folder, "saved_file.txt")
         with open(test_file, 'w') as f:
-            f.write("nested content")
+            f.write("first draft")
         
-        # Wait for processing
-        time.sleep(0.5)
+        # Act
+        with patch('src.core.file_monitor.time', FakeClock()):
+            monitor.event_handler.dispatch(FileCreatedEvent(test_file))
+            with open(test_file, 'w') as f:
+                f.write("second, longer draft")
+            for _ in range(5):
+                monitor.event_handler.dispatch(FileModifiedEvent(test_file))
+            monitor.event_handler.flush_pending()
         
-        # Clean up
-        monitor_thread.join(timeout=3)
+        # Assert
+        assert self.processor.calls == [test_file, test_file]
+        assert monitor.event_handler.get_stats()['duplicate_events_filtered'] == 4
+    
+    def test_modify_without_recent_processing_is_ignored(self):
+        """Test that a MODIFY for a path with no open burst does not trigger processing."""
+        # Arrange
+        monitor = FileMonitor(self.source_folder, self.processor, self.logger)
+        test_file = os.path.join(self.source_folder, "untracked_file.txt")
+        with open(test_file, 'w') as f:
+            f.write("content")
+        
+        # Act
+        monitor.event_handler.dispatch(FileModifiedEvent(test_file))
+        monitor.event_handler.flush_pending()
         
         # Assert
-        self.mock_processor.process_file.assert_called()
-        call_args = self.mock_processor.process_file.call_args[0]
-        assert Path(call_args[0]).resolve() == Path(test_file).resolve()
+        assert self.processor.calls == []
+        assert monitor.event_handler.get_stats()['events_received'] == 0
+    
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("fs_monitor")
+    @pytest.mark.skipif(sys.platform != "linux", reason="inotify-only fast path")
+    def test_real_observer_detects_file_creation(self, tmp_path_factory):
+        """Smoke test that the real watchdog Observer delivers file creation events."""
+        # Arrange
+        monitor = FileMonitor(self.source_folder, self.processor, self.logger)
+        
+        # Write the content outside the watched folder so the file appears
+        # fully written and the stability check sees its final size
+        staged_file = tmp_path_factory.mktemp("staging") / "test_file.txt"
+        staged_file.write_text("test content")
+        test_file = os.path.join(self.source_folder, "test_file.txt")
+        
+        monitor.start_monitoring()
+        try:
+            assert monitor.wait_ready()
+            
+            # Act
+            os.link(staged_file, test_file)
+            
+            # Assert
+            assert self.processor.called.wait(timeout=2)
+        finally:
+            monitor.stop_monitoring()
+        
+        # Verify the file path matches what we created (resolve both paths to handle symlinks)
+        assert Path(self.processor.calls[0]).resolve() == Path(test_file).resolve()
 
 
 class TestFileMonitorCoverageEnhancement:
     """Additional tests to improve coverage for FileMonitor and FileEventHandler."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_processor, mock_logger, tmp_path):
         """Set up test fixtures."""
-        self.mock_processor = Mock(spec=FileProcessor)
-        self.mock_logger = Mock(spec=LoggerService)
+        self.mock_processor = mock_processor
+        self.mock_logger = mock_logger
         
-        # Create temporary directory for testing
-        self.temp_dir = tempfile.mkdtemp()
+        # Per-test temporary directory, cleaned up by pytest
+        self.temp_dir = str(tmp_path)
         self.source_folder = self.temp_dir
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_file_event_handler_duplicate_filtering(self):
         """Test duplicate event filtering in FileEventHandler."""
         handler = FileEventHandler(self.mock_processor, self.mock_logger)
@@ -466,13 +659,65 @@ class TestFileMonitorCoverageEnhancement:
         # Second call should be duplicate
         assert handler._is_duplicate_event(file_path) is True
         
-        # Test cleanup of recent files when limit exceeded
-        # Add exactly 100 more files to trigger cleanup (we already have 1)
-        for i in range(100):
+        # Test eviction of the least recently seen entries once over capacity
+        for i in range(200):
             handler._is_duplicate_event(f"/test/file_{i}.txt")
         
-        # At this point we should have exactly 101 files, triggering cleanup to 50
-        assert len(handler._recent_files) == 50
+        assert len(handler._recent_files) <= 128
+        assert file_path not in handler._recent_files
+        assert "/test/file_199.txt" in handler._recent_files
+        assert handler._is_duplicate_event("/test/file_199.txt") is True
+    
+    def test_file_event_handler_duplicate_filtering_readded_path_is_newest(self):
+        """Test that a processed and re-added path is evicted by its newest insertion."""
+        handler = FileEventHandler(self.mock_processor, self.mock_logger)
+        capacity = handler.RECENT_FILES_CAPACITY
+        file_path = "/test/file.txt"
+        
+        # Track, then forget (as after successful processing), then track again
+        handler._is_duplicate_event(file_path)
+        handler._recent_files.pop(file_path)
+        handler._is_duplicate_event(file_path)
+        
+        # Fill the rest of the capacity without pushing the path out
+        for i in range(capacity - 1):
+            handler._is_duplicate_event(f"/test/other_{i}.txt")
+        
+        assert handler._is_duplicate_event(file_path) is True
+    
+    def test_file_event_handler_duplicate_filtering_hit_refreshes_recency(self):
+        """Test that a duplicate hit moves the path to the back of the eviction order."""
+        handler = FileEventHandler(self.mock_processor, self.mock_logger)
+        capacity = handler.RECENT_FILES_CAPACITY
+        file_path = "/test/file.txt"
+        
+        handler._is_duplicate_event(file_path)
+        for i in range(capacity - 1):
+            handler._is_duplicate_event(f"/test/other_{i}.txt")
+        
+        # The hit makes the path most recent, so the next insert evicts other_0
+        assert handler._is_duplicate_event(file_path) is True
+        handler._is_duplicate_event("/test/newcomer.txt")
+        
+        assert file_path in handler._recent_files
+        assert "/test/other_0.txt" not in handler._recent_files
+    
+    def test_file_event_handler_duplicate_filtering_expires_after_ttl(self):
+        """Test that a path is no longer a duplicate once its TTL has passed."""
+        handler = FileEventHandler(self.mock_processor, self.mock_logger)
+        file_path = "/test/file.txt"
+        
+        with patch('src.core.file_monitor.time.monotonic', return_value=1000.0):
+            assert handler._is_duplicate_event(file_path) is False
+        
+        with patch('src.core.file_monitor.time.monotonic',
+                   return_value=1000.0 + handler.RECENT_FILES_TTL - 1):
+            assert handler._is_duplicate_event(file_path) is True
+        
+        # Measured from the last event, so the refreshed entry lasts another TTL
+        with patch('src.core.file_monitor.time.monotonic',
+                   return_value=1000.0 + 2 * handler.RECENT_FILES_TTL):
+            assert handler._is_duplicate_event(file_path) is False
     
     def test_file_event_handler_wait_for_file_stability_file_disappears(self):
         """Test file stability check when file disappears."""
@@ -491,20 +736,28 @@ class TestFileMonitorCoverageEnhancement:
         with open(test_file, 'w') as f:
             f.write("initial content")
         
-        # Mock os.path.getsize to return different sizes
-        with patch('os.path.getsize') as mock_getsize:
-            mock_getsize.side_effect = [100, 200]  # Size changes
-            
+        # Two stat samples whose size differs
+        samples = [_stat_result(100, mtime_ns=1), _stat_result(200, mtime_ns=1)]
+        with patch('src.core.file_monitor.os.stat', side_effect=samples) as mock_stat:
             result = handler._wait_for_file_stability(test_file, 0.01)
             assert result is False
+            assert mock_stat.call_count == 2
+    
+    def test_file_event_handler_wait_for_file_stability_mtime_changes(self):
+        """Test file stability check when the file is rewritten at the same size."""
+        handler = FileEventHandler(self.mock_processor, self.mock_logger)
+        
+        samples = [_stat_result(100, mtime_ns=1), _stat_result(100, mtime_ns=2)]
+        with patch('src.core.file_monitor.os.stat', side_effect=samples):
+            assert handler._wait_for_file_stability("/test/file.txt", 0.01) is False
     
     def test_file_event_handler_wait_for_file_stability_os_error(self):
         """Test file stability check with OS error."""
         handler = FileEventHandler(self.mock_processor, self.mock_logger)
         
-        # Mock os.path.getsize to raise OSError
-        with patch('os.path.getsize') as mock_getsize:
-            mock_getsize.side_effect = OSError("File access error")
+        # Mock the stat-based signature lookup to raise OSError
+        with patch.object(handler, '_get_file_signature') as mock_signature:
+            mock_signature.side_effect = OSError("File access error")
             
             result = handler._wait_for_file_stability("/test/file.txt", 0.1)
             assert result is False
@@ -526,12 +779,13 @@ class TestFileMonitorCoverageEnhancement:
         with open(test_file, 'w') as f:
             f.write("test content")
         
-        # Mock open to raise PermissionError
-        with patch('builtins.open') as mock_open:
-            mock_open.side_effect = PermissionError("Access denied")
-            
+        # Mock os.access to report the file as unreadable
+        with patch('src.core.file_monitor.os.access', return_value=False) as mock_access:
             result = handler._validate_file_ready(test_file)
             assert result is False
+        
+        mock_access.assert_called_once_with(test_file, os.R_OK)
+        self.mock_logger.log_error.assert_called_once()
     
     def test_file_event_handler_process_file_with_resilience_max_attempts(self):
         """Test file processing with maximum retry attempts."""
@@ -547,13 +801,63 @@ class TestFileMonitorCoverageEnhancement:
         
         # Mock file validation to pass
         with patch.object(handler, '_wait_for_file_stability', return_value=True), \
-             patch.object(handler, '_validate_file_ready', return_value=True):
+             patch.object(handler, '_validate_file_ready', return_value=True), \
+             patch('src.core.file_monitor.time.sleep') as mock_sleep:
             
             handler._process_file_with_resilience(test_file)
             
             # Should have attempted processing 5 times (max_stability_checks)
             assert self.mock_processor.process_file.call_count == 5
             assert handler.stats['processing_errors'] == 1
+            
+            # Backoff doubles from 50ms, with up to 10ms of jitter
+            delays = [c.args[0] for c in mock_sleep.call_args_list]
+            assert len(delays) == 4
+            for delay, base in zip(delays, [0.05, 0.1, 0.2, 0.4]):
+                assert base <= delay < base + 0.01
+    
+    @pytest.mark.parametrize("error", [
+        FileNotFoundError("gone"),
+        PermissionError("denied"),
+        IsADirectoryError("directory"),
+    ], ids=["file_not_found", "permission", "is_a_directory"])
+    def test_file_event_handler_process_file_with_resilience_non_retryable(self, error):
+        """Test that non-retryable processing errors are not retried."""
+        handler = FileEventHandler(self.mock_processor, self.mock_logger)
+        self.mock_processor.process_file.side_effect = error
+        
+        with patch.object(handler, '_wait_for_file_stability', return_value=True), \
+             patch.object(handler, '_validate_file_ready', return_value=True), \
+             patch('src.core.file_monitor.time.sleep') as mock_sleep:
+            
+            handler._process_file_with_resilience("/test/file.txt")
+        
+        assert self.mock_processor.process_file.call_count == 1
+        assert handler.stats['processing_errors'] == 1
+        mock_sleep.assert_not_called()
+    
+    def test_file_event_handler_directory_waits_for_stability_once(self):
+        """Test that files found in a new directory share one stability wait."""
+        handler = FileEventHandler(self.mock_processor, self.mock_logger)
+        self.mock_processor.process_file.return_value = ProcessingResult(
+            success=True, file_path="", processing_time=0.1
+        )
+        
+        # Create a directory with several files
+        new_dir = os.path.join(self.temp_dir, "incoming")
+        os.makedirs(os.path.join(new_dir, "nested"))
+        for name in ("a.txt", "b.txt", os.path.join("nested", "c.txt")):
+            with open(os.path.join(new_dir, name), 'w') as f:
+                f.write("content")
+        
+        with patch.object(handler, '_wait_for_file_stability') as mock_stability, \
+             patch('src.core.file_monitor.time.sleep') as mock_sleep:
+            handler._process_directory_recursively(new_dir)
+        
+        # One shared wait for the batch, and no per-file stability waits
+        assert self.mock_processor.process_file.call_count == 3
+        mock_sleep.assert_called_once_with(0.2)
+        mock_stability.assert_not_called()
     
     def test_file_event_handler_get_stats(self):
         """Test getting event handler statistics."""
@@ -704,11 +1008,30 @@ class TestFileMonitorCoverageEnhancement:
         mock_observer.is_alive.return_value = True
         monitor.observer = mock_observer
         
-        # Mock Path.exists to raise exception
-        with patch('pathlib.Path.exists', side_effect=Exception("Health check error")):
+        # Mock os.stat to raise exception
+        with patch('src.core.file_monitor.os.stat', side_effect=Exception("Health check error")):
             result = monitor.is_monitoring()
             assert result is False
     
+    def test_file_monitor_is_monitoring_caches_health_check(self):
+        """Test is_monitoring reuses a recent source folder health check."""
+        monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
+        
+        mock_observer = Mock()
+        mock_observer.is_alive.return_value = True
+        monitor.observer = mock_observer
+        
+        assert monitor.is_monitoring() is True
+        
+        # Within the TTL the cached result is returned without re-checking
+        import shutil
+        shutil.rmtree(self.source_folder)
+        assert monitor.is_monitoring() is True
+        
+        # Once the cache is cleared the folder is checked again
+        monitor._health_cache = None
+        assert monitor.is_monitoring() is False
+    
     def test_file_monitor_get_monitoring_stats(self):
         """Test get_monitoring_stats method."""
         monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
@@ -751,23 +1074,33 @@ class TestFileMonitorCoverageEnhancement:
 class TestFileMonitorEmptyFolderHandling:
     """Test cases for FileMonitor empty folder handling functionality (Task 15.2)."""
     
-    def setup_method(self):
+    @pytest.fixture(scope="class")
+    def mock_processor_template(self):
+        """FileProcessor mock with a mock FileManager attached, built once per class.
+        
+        The module-wide template is spec_set, which rejects the file_manager
+        instance attribute, so empty folder detection gets its own.
+        """
+        processor = create_autospec(FileProcessor, instance=True)
+        processor.file_manager = Mock()
+        return processor
+    
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_processor, mock_logger, tmp_path):
         """Set up test fixtures."""
-        self.mock_processor = Mock(spec=FileProcessor)
-        self.mock_logger = Mock(spec=LoggerService)
+        self.mock_processor = mock_processor
+        self.mock_logger = mock_logger
         
-        # Create temporary directory for testing
-        self.temp_dir = tempfile.mkdtemp()
+        # Per-test temporary directory, cleaned up by pytest. Resolved once
+        # (macOS /var -> /private/var) so child paths match the monitor's own
+        self.temp_dir = os.path.realpath(tmp_path)
         self.source_folder = self.temp_dir
         
-        # Mock FileManager for empty folder detection
-        self.mock_file_manager = Mock()
-        self.mock_processor.file_manager = self.mock_file_manager
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        # Mock FileManager for empty folder detection, reset with the processor
+        self.mock_file_manager = self.mock_processor.file_manager
+        
+        # None of these tests changes what the monitor binds at construction
+        self.monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
     
     def test_scan_for_empty_folders_finds_completely_empty_folders(self):
         """Test scanning for completely empty folders."""
@@ -776,48 +1109,53 @@ class TestFileMonitorEmptyFolderHandling:
         empty_folder2 = os.path.join(self.source_folder, "subdir", "empty2")
         non_empty_folder = os.path.join(self.source_folder, "non_empty")
         
-        os.makedirs(empty_folder1)
-        os.makedirs(empty_folder2)
-        os.makedirs(non_empty_folder)
+        # makedirs on empty2 creates "subdir" on the way
+        for folder in (empty_folder1, empty_folder2, non_empty_folder):
+            os.makedirs(folder)
         
         # Add file to non-empty folder
-        with open(os.path.join(non_empty_folder, "file.txt"), 'w') as f:
-            f.write("content")
+        _touch(os.path.join(non_empty_folder, "file.txt"))
         
         # Mock FileManager to return True for empty folders, False for non-empty
-        def mock_is_completely_empty(path):
-            # Resolve symlinks to handle macOS /private/var vs /var differences
-            resolved_path = os.path.realpath(path)
-            resolved_empty1 = os.path.realpath(empty_folder1)
-            resolved_empty2 = os.path.realpath(empty_folder2)
-            
-            # Check if path matches our target empty folders
-            if resolved_path == resolved_empty1 or resolved_path == resolved_empty2:
-                return True
-            # Also check for subdir which should not be empty (contains empty2)
-            if path.endswith("subdir") or path.endswith("non_empty"):
-                return False
-            return False
+        expected_empty = frozenset({empty_folder1, empty_folder2})
+        
+        def mock_is_completely_empty(path, known_empty=False):
+            return path in expected_empty
         
         self.mock_file_manager.should_process_as_empty_folder.side_effect = mock_is_completely_empty
         
-        # Create monitor and scan
-        monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        empty_folders = monitor.scan_for_empty_folders()
+        empty_folders = self.monitor.scan_for_empty_folders()
         
-        # Verify results
-        assert len(empty_folders) == 2
+        # Verify results - the source folder was resolved in setup, so
+        # reported paths compare as plain strings
+        assert set(empty_folders) == expected_empty
+        assert len(empty_folders) == len(expected_empty)
+        assert non_empty_folder not in empty_folders
         
-        # Use realpath to resolve symlinks for comparison
-        resolved_empty_folders = [os.path.realpath(f) for f in empty_folders]
-        resolved_empty1 = os.path.realpath(empty_folder1)
-        resolved_empty2 = os.path.realpath(empty_folder2)
-        resolved_non_empty = os.path.realpath(non_empty_folder)
+        # The scan's own listing proved emptiness, so FileManager is told so
+        for scan_call in self.mock_file_manager.should_process_as_empty_folder.call_args_list:
+            assert scan_call.kwargs == {'known_empty': True}
+    
+    def test_scan_for_empty_folders_parallel_matches_serial(self):
+        """Test that a parallel scan finds the same empty folders as a serial one."""
+        expected_empty = set()
+        for top in ("a", "b", "c"):
+            os.makedirs(os.path.join(self.source_folder, top, "empty"))
+            expected_empty.add(os.path.join(self.source_folder, top, "empty"))
+            _touch(os.path.join(self.source_folder, top, "file.txt"))
+        os.makedirs(os.path.join(self.source_folder, "top_empty"))
+        expected_empty.add(os.path.join(self.source_folder, "top_empty"))
+        
+        self.mock_file_manager.should_process_as_empty_folder.return_value = True
+        parallel_monitor = FileMonitor(
+            self.source_folder, self.mock_processor, self.mock_logger, parallel_scan=True
+        )
         
-        assert resolved_empty1 in resolved_empty_folders
-        assert resolved_empty2 in resolved_empty_folders
-        # Verify non-empty folder is not included
-        assert resolved_non_empty not in resolved_empty_folders
+        # Completion order is not deterministic, so compare as sets
+        parallel_found = parallel_monitor.scan_for_empty_folders()
+        assert set(parallel_found) == expected_empty
+        assert len(parallel_found) == len(expected_empty)
+        assert set(self.monitor.scan_for_empty_folders()) == expected_empty
     
     def test_handle_empty_folders_processes_found_folders(self):
         """Test handling of found empty folders."""
@@ -825,16 +1163,11 @@ class TestFileMonitorEmptyFolderHandling:
         empty_folders = ["/source/empty1", "/source/empty2"]
         
         # Mock successful processing results
-        success_result1 = ProcessingResult(success=True, file_path="/source/empty1")
-        success_result2 = ProcessingResult(success=True, file_path="/source/empty2")
-        
-        self.mock_processor.process_empty_folder.side_effect = [success_result1, success_result2]
+        self.mock_processor.process_empty_folder.return_value = _SUCCESS_TEMPLATE
         
-        monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
-        
-        # Mock scan_for_empty_folders to return our test folders
-        with patch.object(monitor, 'scan_for_empty_folders', return_value=empty_folders):
-            processed_count = monitor.handle_empty_folders()
+        # Mock the scan to yield our test folders
+        with patch.object(self.monitor, '_iter_empty_folders', return_value=iter(empty_folders)):
+            processed_count = self.monitor.handle_empty_folders()
         
         # Verify processing
         assert processed_count == 2
@@ -843,8 +1176,24 @@ class TestFileMonitorEmptyFolderHandling:
         self.mock_processor.process_empty_folder.assert_any_call("/source/empty2")
         
         # Verify success logging
-        self.mock_logger.log_info.assert_any_call("Successfully processed empty folder: /source/empty1")
-        self.mock_logger.log_info.assert_any_call("Successfully processed empty folder: /source/empty2")
+        logged = {c.args[0] for c in self.mock_logger.log_info.call_args_list}
+        assert "Successfully processed empty folder: /source/empty1" in logged
+        assert "Successfully processed empty folder: /source/empty2" in logged
+    
+    def test_handle_empty_folders_processes_while_scanning(self):
+        """Test that each empty folder is processed as soon as the scan yields it."""
+        self.mock_processor.process_empty_folder.return_value = _SUCCESS_TEMPLATE
+        
+        def scan():
+            yield "/source/empty1"
+            # The first folder was handled before the scan moved on
+            assert self.mock_processor.process_empty_folder.call_count == 1
+            yield "/source/empty2"
+        
+        with patch.object(self.monitor, '_iter_empty_folders', return_value=scan()):
+            processed_count = self.monitor.handle_empty_folders()
+        
+        assert processed_count == 2
     
     def test_empty_folder_integration_with_file_processing_workflow(self):
         """Test integration of empty folder handling with regular file processing workflow."""
@@ -852,25 +1201,19 @@ class TestFileMonitorEmptyFolderHandling:
         test_file = os.path.join(self.source_folder, "test.txt")
         empty_folder = os.path.join(self.source_folder, "empty")
         
-        with open(test_file, 'w') as f:
-            f.write("test content")
+        _touch(test_file, b"test content")
         os.makedirs(empty_folder)
         
         # Mock FileManager methods
         self.mock_file_manager.is_completely_empty_folder.side_effect = lambda path: path == empty_folder
         
         # Mock successful processing results
-        file_result = ProcessingResult(success=True, file_path=test_file)
-        folder_result = ProcessingResult(success=True, file_path=empty_folder)
-        
-        self.mock_processor.process_file.return_value = file_result
-        self.mock_processor.process_empty_folder.return_value = folder_result
-        
-        monitor = FileMonitor(self.source_folder, self.mock_processor, self.mock_logger)
+        self.mock_processor.process_file.return_value = _SUCCESS_TEMPLATE
+        self.mock_processor.process_empty_folder.return_value = _SUCCESS_TEMPLATE
         
         # Test that both file and empty folder processing work together
-        with patch.object(monitor, 'scan_for_empty_folders', return_value=[empty_folder]):
-            processed_count = monitor.handle_empty_folders()
+        with patch.object(self.monitor, '_iter_empty_folders', return_value=iter([empty_folder])):
+            processed_count = self.monitor.handle_empty_folders()
         
         # Verify empty folder was processed
         assert processed_count == 1
@@ -883,20 +1226,16 @@ class TestFileMonitorEmptyFolderHandling:
 class TestFileMonitorExistingFilesProcessing:
     """Test cases for FileMonitor existing files processing functionality."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_processor, mock_logger, tmp_path):
         """Set up test fixtures."""
-        self.mock_processor = Mock(spec=FileProcessor)
-        self.mock_logger = Mock(spec=LoggerService)
+        self.mock_processor = mock_processor
+        self.mock_logger = mock_logger
         
-        # Create temporary directory for testing
-        self.temp_dir = tempfile.mkdtemp()
+        # Per-test temporary directory, cleaned up by pytest
+        self.temp_dir = str(tmp_path)
         self.source_folder = self.temp_dir
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_process_existing_files_finds_all_files(self):
         """Test that _process_existing_files finds all files recursively."""
         # Create test file structure